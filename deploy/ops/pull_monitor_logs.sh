@@ -102,10 +102,12 @@ if ! ssh "${REMOTE_USER}@${REMOTE_HOST}" "[ -d \"$REMOTE_PATH\" ]"; then
   exit 2
 fi
 
-# Only sync JSON and LOG files; ensure directories are traversed.
+# Only sync JSON event files, NDJSON daily logs and LOG files; ensure directories are traversed.
+# Daily logs grow during the day: rsync transfers the appended part on each pull.
 RSYNC_FILTER=(
   --include='*/'
   --include='*.json'
+  --include='*.ndjson'
   --include='*.log'
   --exclude='*'
 )
@@ -170,7 +172,7 @@ rsync "${RSYNC_COMMON_OPTS[@]}" --progress --partial --stats \
 if [[ $RSYNC_EXIT_CODE -ne 0 ]]; then
   if [[ $RSYNC_EXIT_CODE -eq 23 ]]; then
     log "⚠️  Sync completed with some files skipped (exit 23)."
-    log "    Regular files (.json, .log) likely transferred fine."
+    log "    Regular files (.json, .ndjson, .log) likely transferred fine."
     if [[ "$DIAGNOSE_MODE" == "false" ]]; then
       log "    Run with --diagnose to see which files caused issues."
     fi
@@ -182,7 +184,7 @@ else
   log "✅ Sync completed successfully!"
   log "Files are in: ${LOCAL_PATH}"
   # Safe find with precedence parentheses
-  FILE_COUNT=$(find "$LOCAL_PATH" \( -name "*.json" -o -name "*.log" \) | wc -l | tr -d ' ')
-  log "Total files in local directory: ${FILE_COUNT}"
+  FILE_COUNT=$(find "$LOCAL_PATH" \( -name "*.json" -o -name "*.ndjson" -o -name "*.log" \) | wc -l | tr -d ' ')
+  log "Total log files (.json, .ndjson, .log) in local directory: ${FILE_COUNT}"
   log "Completed at $(date '+%Y-%m-%d %H:%M:%S')"
 fi
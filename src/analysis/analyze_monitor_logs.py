@@ -8,21 +8,37 @@ Usage:
       --out monitor_analysis
 
 What it does:
-  - Recursively loads all *.json files (fits in memory for ~tens of thousands).
-  - Optionally validates each JSON against your Pydantic MonitorEvent schema.
+  - Recursively loads all *.json event files and *.ndjson daily logs of one
+    event per line (fits in memory for ~tens of thousands of events),
+    parsing them in parallel on all cores.
+  - Optionally validates each JSON against your Pydantic MonitorEvent schema,
+    or with the faster built-in msgspec struct (--msgspec).
   - Normalizes into a flat table with common fields + event-specific columns.
-  - Writes CSV + Parquet (fast to reload) and a quick markdown summary.
+  - Writes Parquet (ZSTD, fast to reload), optionally CSV (--csv),
+    and a quick markdown summary.
 """
 
 import argparse
 import json
 import logging
+import mmap
+import os
 import re
-from datetime import UTC, datetime
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
+import msgspec
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from pydantic import TypeAdapter
 
 # Configure logging
 logging.basicConfig(
@@ -31,16 +47,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Regex pattern for parsing session log filenames
+# Regex pattern for parsing session log filenames, used with fullmatch
 FILENAME_RE = re.compile(
-    r"^session_(?P<key>[a-zA-Z0-9_-]+)-(?P<ts>\d{8}T\d{6}\d{3})Z-"
-    r"(?P<type>[a-zA-Z]+)\.json$"
+    r"session_(?P<key>[a-zA-Z0-9_-]+)-(?P<ts>\d{8}T\d{6}\d{3})Z-"
+    r"(?P<type>[a-zA-Z]+)\.json"
 )
 
 
-def parse_filename(name: str) -> tuple[str | None, str | None, str | None]:
+def _parse_filename_fast(name: str) -> tuple[str, str, str] | None:
     """
-    Parse session filename to extract key, timestamp, and event type.
+    Split a session filename by slicing, without the regex engine.
+
+    Accepts exactly the names FILENAME_RE matches: the layout, the session
+    key characters, the timestamp digits and the event type letters are all
+    checked, with str methods instead of the regex engine.
 
     Args:
     ----
@@ -48,46 +68,59 @@ def parse_filename(name: str) -> tuple[str | None, str | None, str | None]:
 
     Returns:
     -------
-        A tuple of (session_key, iso_timestamp, event_type).
-        Returns (None, None, None) if filename doesn't match expected pattern.
+        A tuple of (session_key, compact_timestamp, event_type), or None when
+        the name does not have the expected layout.
 
     """
-    m = FILENAME_RE.match(name)
-    if not m:
-        return None, None, None
-    key = m.group("key")
-    ts_compact = m.group("ts")
-    ts_iso = (
-        f"{ts_compact[0:4]}-{ts_compact[4:6]}-{ts_compact[6:8]}T"
-        f"{ts_compact[9:11]}:{ts_compact[11:13]}:{ts_compact[13:15]}."
-        f"{ts_compact[15:18]}Z"
-    )
-    typ = m.group("type")
-    return key, ts_iso, typ
+    if not (name.startswith("session_") and name.endswith(".json")):
+        return None
+    stem = name[8:-5]
+    dash = stem.rfind("-")
+    z = dash - 1  # position of the "Z" closing the timestamp
+    if z < 20 or stem[z] != "Z" or stem[z - 19] != "-" or stem[z - 10] != "T":
+        return None
+    key = stem[: z - 19]
+    ts_compact = stem[z - 18 : z]
+    typ = stem[dash + 1 :]
+    # Once ASCII, isalnum accepts [a-zA-Z0-9]; keys may also hold "_" and "-"
+    key_letters = key.replace("_", "").replace("-", "")
+    if not (
+        name.isascii()
+        and (not key_letters or key_letters.isalnum())
+        and ts_compact.replace("T", "", 1).isdigit()
+        and typ.isalpha()
+    ):
+        return None
+    return key, ts_compact, typ
 
 
-def iso_norm(ts: str) -> str | None:
+def parse_filename(name: str) -> tuple[str | None, str | None, str | None]:
     """
-    Normalize ISO timestamp to UTC format.
+    Parse session filename to extract key, timestamp, and event type.
 
     Args:
     ----
-        ts: ISO format timestamp string.
+        name: The filename to parse.
 
     Returns:
     -------
-        Normalized UTC timestamp string, or None if parsing fails.
+        A tuple of (session_key, iso_timestamp, event_type).
+        Returns (None, None, None) if filename doesn't match expected pattern.
 
     """
-    try:
-        if ts.endswith("Z"):
-            dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-        else:
-            dt = datetime.fromisoformat(ts)
-        dt = dt.astimezone(UTC)
-        return dt.replace(tzinfo=UTC).isoformat().replace("+00:00", "Z")
-    except Exception:
-        return None
+    parts = _parse_filename_fast(name)
+    if parts is None:
+        m = FILENAME_RE.fullmatch(name)
+        if not m:
+            return None, None, None
+        parts = m.group("key"), m.group("ts"), m.group("type")
+    key, ts_compact, typ = parts
+    ts_iso = (
+        f"{ts_compact[0:4]}-{ts_compact[4:6]}-{ts_compact[6:8]}T"
+        f"{ts_compact[9:11]}:{ts_compact[11:13]}:{ts_compact[13:15]}."
+        f"{ts_compact[15:18]}Z"
+    )
+    return key, ts_iso, typ
 
 
 def load_monitor_schema(module_path: Path | None) -> tuple[Any, Any]:
@@ -124,6 +157,65 @@ def load_monitor_schema(module_path: Path | None) -> tuple[Any, Any]:
         return None, None
 
 
+# Mirrors MonitorEventType in src/monitor/models.py
+EventTypeName = Literal[
+    "sessionStart",
+    "request",
+    "response",
+    "article",
+    "feedback",
+    "userProfile",
+    "userInput",
+    "visibilityChange",
+]
+
+
+class MonitorEventStruct(msgspec.Struct):
+    """Monitor event validated by msgspec, as strictly as the MonitorEvent schema."""
+
+    sessionId: str
+    timestamp: str
+    eventType: EventTypeName
+    payload: dict[str, Any]
+
+
+# Built once per process: the decoder compiles its type once, then is reused
+MONITOR_EVENT_DECODER = msgspec.json.Decoder(MonitorEventStruct)
+
+
+# Low-cardinality columns stored dictionary-encoded (pandas category on reload).
+# sessionId stays plain: groupby on a category also yields unobserved groups.
+CATEGORICAL_COLUMNS = frozenset(
+    {"eventType", "canonical_event_type", "validation_error"}
+)
+
+# Rows per Parquet row group, and per batch held in memory while writing
+ROW_GROUP_SIZE = 10_000
+
+# Files at least this large are memory-mapped rather than read into bytes
+MMAP_MIN_SIZE = 16 * 1024
+
+# Raw event timestamps, normalized in bulk by _normalize_timestamps
+EVENT_TS_COL = "_event_timestamp"
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+# Columns every event has, in the order of the values built by _process_file
+ROW_COLUMNS = (
+    "source_file",
+    "size_bytes",
+    "mtime_utc",
+    "sessionId",
+    "timestamp",
+    EVENT_TS_COL,
+    "eventType",
+    "canonical_event_type",
+    "valid",
+    "validation_error",
+    "payload_json",
+    "payload_unknown_json",
+)
+ROW_INDEX = {name: i for i, name in enumerate(ROW_COLUMNS)}
+
 # Known payload fields for each event type
 KNOWN_KEYS_BY_EVENT = {
     "request": {"queryId", "query", "settings", "requestBody"},
@@ -141,6 +233,16 @@ KNOWN_KEYS_BY_EVENT = {
     "article": set(),
     "userProfile": set(),
 }
+# Frozen and interned: payload keys are then mostly matched by identity
+KNOWN_KEYS: dict[str, frozenset[str]] = {
+    event_type: frozenset(sys.intern(k) for k in keys)
+    for event_type, keys in KNOWN_KEYS_BY_EVENT.items()
+}
+# Per event type, each known key with its slot in ROW_COLUMNS (None: extra column)
+FIELD_SLOTS: dict[str, tuple[tuple[str, int | None], ...]] = {
+    event_type: tuple((k, ROW_INDEX.get(k)) for k in sorted(keys))
+    for event_type, keys in KNOWN_KEYS.items()
+}
 
 
 def split_known_unknown(
@@ -159,10 +261,16 @@ def split_known_unknown(
         A tuple of (known_fields, unknown_fields) dictionaries.
 
     """
+    if not payload:
+        return {}, {}
+    allowed = KNOWN_KEYS.get(event_type)
+    if allowed is None:
+        return {}, payload
+    if payload.keys() <= allowed:
+        return payload, {}
     known = {}
     unknown = {}
-    allowed = KNOWN_KEYS_BY_EVENT.get(event_type, set())
-    for k, v in (payload or {}).items():
+    for k, v in payload.items():
         if k in allowed:
             known[k] = v
         else:
@@ -183,123 +291,590 @@ def safe_json_dump(x: Any) -> str:
         JSON string representation, or repr() fallback if serialization fails.
 
     """
+    try:
+        return orjson.dumps(x, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        pass
+    # orjson rejects some values stdlib json accepts, e.g. integers over 64 bits
     try:
         return json.dumps(x, ensure_ascii=False, separators=(",", ":"))
     except Exception:
         return repr(x)
 
 
-def walk_and_collect(root: Path, MonitorEvent: Any = None) -> list[dict[str, Any]]:
+# Validator of the current worker process, set by _init_worker
+_MONITOR_EVENT: Any = None
+_MONITOR_ADAPTER: TypeAdapter[Any] | None = None
+_USE_MSGSPEC = False
+_TRUST_INPUT = False
+# Fields --trust-input requires before building an event without validation
+_REQUIRED_FIELDS: frozenset[str] = frozenset()
+# Reused by _json_buffer for small files; workers are single-threaded
+_READ_BUFFER = bytearray(MMAP_MIN_SIZE)
+
+
+def _init_worker(
+    schema_path: Path | None, use_msgspec: bool = False, trust_input: bool = False
+) -> None:
     """
-    Walk directory tree and collect all monitor events.
+    Load the MonitorEvent schema once per worker process.
+
+    Classes built by importlib are not picklable, so each worker re-imports
+    the schema module from its path instead of receiving the class. The
+    TypeAdapter is compiled here once and reused for every file.
+
+    Args:
+    ----
+        schema_path: Path to the Pydantic schema file, or None to skip validation.
+        use_msgspec: Validate with MonitorEventStruct instead of the schema.
+        trust_input: Build schema instances without validating them, when they
+            have all the required fields.
+
+    """
+    global _MONITOR_EVENT, _MONITOR_ADAPTER, _USE_MSGSPEC, _TRUST_INPUT
+    global _REQUIRED_FIELDS
+    _USE_MSGSPEC = use_msgspec
+    _TRUST_INPUT = trust_input
+    _MONITOR_EVENT = None if use_msgspec else load_monitor_schema(schema_path)[0]
+    _MONITOR_ADAPTER = TypeAdapter(_MONITOR_EVENT) if _MONITOR_EVENT else None
+    _REQUIRED_FIELDS = frozenset(
+        name
+        for name, field in getattr(_MONITOR_EVENT, "model_fields", {}).items()
+        if field.is_required()
+    )
+
+
+def _iter_json_files(root: Path) -> list[tuple[str, int, float]]:
+    """
+    List all *.json event files and *.ndjson daily logs below root, with os.scandir.
+
+    The stat results come from the DirEntry objects of the walk, so workers
+    do not need another stat call per file.
 
     Args:
     ----
         root: Root directory to search for JSON files.
-        MonitorEvent: Optional Pydantic model for validation.
 
     Returns:
     -------
-        List of dictionaries containing normalized event data.
+        List of (path, size_bytes, mtime) tuples.
 
     """
-    rows: list[dict[str, Any]] = []
-    for p in root.rglob("*.json"):
-        st = p.stat()
-        key_f, ts_f, type_f = parse_filename(p.name)
-        type_f = type_f or "other"
+    files: list[tuple[str, int, float]] = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith((".json", ".ndjson")):
+                    st = entry.stat()
+                    files.append((entry.path, st.st_size, st.st_mtime))
+    return files
+
+
+@contextmanager
+def _json_buffer(path: str, size: int) -> Iterator[bytes | memoryview]:
+    """
+    Give access to a file's bytes, memory-mapping it when it is large.
+
+    Small files are read into a reusable buffer rather than a fresh bytes
+    object, large ones are decoded straight from the page cache without a
+    copy.
+
+    Args:
+    ----
+        path: Path of the file to read.
+        size: File size in bytes, as known from the directory walk.
+
+    Yields:
+    ------
+        The file content, valid until the context exits.
+
+    """
+    with open(path, "rb", buffering=0) as f:
+        if size < MMAP_MIN_SIZE:
+            n = f.readinto(_READ_BUFFER)
+            if n < len(_READ_BUFFER):
+                with memoryview(_READ_BUFFER) as buf, buf[:n] as view:
+                    yield view
+            else:
+                # the file grew since the directory walk
+                yield bytes(_READ_BUFFER) + f.read()
+            return
+        with (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            memoryview(mm) as view,
+        ):
+            yield view
+
+
+def _decode(data: bytes | memoryview) -> tuple[Any, Any, str | None]:
+    """
+    Decode an event and validate it with the validator configured for this worker.
+
+    With msgspec the typed decode already yields the payload, so the untyped
+    document is only parsed when validation fails.
+
+    Args:
+    ----
+        data: The raw JSON bytes.
+
+    Returns:
+    -------
+        A tuple of (document, validated_event, error_message).
+        The document is None when the event already carries the payload, the
+        event is None when validation failed or is disabled.
+
+    """
+    if _USE_MSGSPEC:
         try:
-            doc = json.loads(p.read_text(encoding="utf-8"))
-        except Exception as e:
-            rows.append(
-                {
-                    "source_file": str(p),
-                    "size_bytes": st.st_size,
-                    "mtime_utc": datetime.fromtimestamp(st.st_mtime, UTC).isoformat(),
-                    "sessionId": key_f or f"unknown-{p.parent.name}",
-                    "timestamp": (
-                        ts_f or datetime.fromtimestamp(st.st_mtime, UTC).isoformat()
-                    ),
-                    "eventType": type_f,
-                    "canonical_event_type": None,
-                    "valid": False,
-                    "validation_error": f"JSON parse error: {e!r}",
-                    "payload_json": None,
-                    "payload_unknown_json": None,
-                }
-            )
+            return None, MONITOR_EVENT_DECODER.decode(data), None
+        except msgspec.ValidationError as e:
+            return orjson.loads(data), None, f"msgspec validation error: {e!r}"
+        except msgspec.DecodeError:
+            # report malformed JSON the same way as the other validators
+            orjson.loads(data)
+            raise
+    doc = orjson.loads(data)
+    if _MONITOR_EVENT is None or _MONITOR_ADAPTER is None:
+        return doc, None, None
+    try:
+        if _TRUST_INPUT and isinstance(doc, dict) and _REQUIRED_FIELDS <= doc.keys():
+            # model_construct skips every validator: only safe for files written
+            # by our own monitor. Events missing required fields are validated
+            # instead, so that they are reported rather than half-built.
+            return doc, _MONITOR_EVENT.model_construct(**doc), None
+        return doc, _MONITOR_ADAPTER.validate_python(doc), None
+    except Exception as e:
+        return doc, None, f"Pydantic validation error: {e!r}"
+
+
+def _extract_fields(
+    event_type: str, payload: dict[str, Any], values: list[Any]
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Copy the known payload fields of an event into the row.
+
+    Walks the precomputed FIELD_SLOTS of the event type instead of testing
+    every payload key, and only builds the unknown fields dict when some
+    payload keys were not matched.
+
+    Args:
+    ----
+        event_type: The type of event being processed.
+        payload: The event payload dictionary.
+        values: Row values in ROW_COLUMNS order, updated in place for known
+            fields that are also fixed columns.
+
+    Returns:
+    -------
+        A tuple of (extra_fields, unknown_fields) dictionaries.
+
+    """
+    slots = FIELD_SLOTS.get(event_type)
+    if slots is None:
+        return split_known_unknown(event_type, payload)
+    extra: dict[str, Any] = {}
+    found = 0
+    for key, index in slots:
+        if key not in payload:
             continue
+        found += 1
+        v = payload[key]
+        # string-ify complex values to keep the table rectangular
+        if not (isinstance(v, str | int | float | bool) or v is None):
+            v = safe_json_dump(v)
+        if index is None:
+            extra[key] = v
+        else:
+            values[index] = v
+    if found == len(payload):
+        return extra, {}
+    allowed = KNOWN_KEYS[event_type]
+    return extra, {k: v for k, v in payload.items() if k not in allowed}
+
+
+Row = tuple[list[Any], dict[str, Any]]
+
+
+def _error_row(
+    file_info: tuple[str, int, float],
+    sessionId: str,
+    ts_f: str | None,
+    type_f: str,
+    error: Exception,
+) -> Row:
+    """
+    Build the row of an event that could not be read or parsed.
+
+    The mtime fallback timestamp is filled in by _normalize_timestamps.
+    """
+    path_str, size_bytes, mtime = file_info
+    values = [path_str, size_bytes, mtime, sessionId, ts_f, None, type_f]
+    values += [None, False, f"JSON parse error: {error!r}", None, None]
+    return values, {}
+
+
+def _event_row(
+    file_info: tuple[str, int, float],
+    sessionId: str,
+    ts_f: str | None,
+    type_f: str,
+    decoded: tuple[Any, Any, str | None],
+    event_timestamp: str | None = None,
+) -> Row:
+    """
+    Normalize a decoded event into a row.
+
+    Args:
+    ----
+        file_info: Tuple of (path, size_bytes, mtime) of the file of the event.
+        sessionId: Session of the event, unless the validated event has one.
+        ts_f: ISO timestamp from the filename, or None.
+        type_f: Event type from the filename, kept as reference.
+        decoded: The (document, validated_event, error_message) from _decode.
+        event_timestamp: Raw event timestamp, unless the validated event has one.
+
+    Returns:
+    -------
+        A tuple of (values, extra_fields): the values of ROW_COLUMNS in
+        order, and the event-specific known payload fields.
 
-        sessionId = key_f or f"unknown-{p.parent.name}"
-        timestamp = ts_f or datetime.fromtimestamp(st.st_mtime, UTC).isoformat()
-        eventType = type_f
-        canonical_event_type = None
-        valid = True
-        validation_error = None
-
-        if MonitorEvent is not None:
-            try:
-                ev = MonitorEvent.model_validate(doc)
-                sessionId = ev.sessionId or sessionId
-                eventType = type_f  # keep filename type as reference
-                canonical_event_type = str(ev.eventType)
-                # normalize timestamp from payload
-                ts_norm = (
-                    iso_norm(ev.timestamp) if getattr(ev, "timestamp", None) else None
-                )
-                if ts_norm:
-                    timestamp = ts_norm
-            except Exception as e:
-                valid = False
-                validation_error = f"Pydantic validation error: {e!r}"
-
-        # Extract payload
-        payload = doc.get("payload") if isinstance(doc, dict) else None
-        known, unknown = split_known_unknown(
-            (canonical_event_type or eventType), payload or {}
+    """
+    path_str, size_bytes, mtime = file_info
+    doc, ev, validation_error = decoded
+    canonical_event_type = None
+    if ev is not None:
+        sessionId = ev.sessionId or sessionId
+        # the enum value with --schema, already a str with --msgspec/--trust-input
+        canonical_event_type = str(getattr(ev.eventType, "value", ev.eventType))
+        # normalized later, see _normalize_timestamps
+        event_timestamp = getattr(ev, "timestamp", None)
+
+    # Extract payload, as already parsed by the validator when there is one
+    payload = getattr(ev, "payload", None)
+    if payload is None and isinstance(doc, dict):
+        payload = doc.get("payload")
+    values = [
+        path_str,
+        size_bytes,
+        mtime,
+        sessionId,
+        ts_f,
+        event_timestamp,
+        type_f,  # keep filename type as reference
+        canonical_event_type,
+        validation_error is None,
+        validation_error,
+        safe_json_dump(payload) if payload is not None else None,
+        None,
+    ]
+    # add known fields as top-level columns
+    extra: dict[str, Any] = {}
+    if isinstance(payload, dict) and payload:
+        extra, unknown = _extract_fields(
+            canonical_event_type or type_f, payload, values
         )
+        if unknown:
+            values[ROW_INDEX["payload_unknown_json"]] = safe_json_dump(unknown)
+    return values, extra
+
+
+def _process_ndjson_file(file_info: tuple[str, int, float]) -> list[Row]:
+    """
+    Load, validate and normalize the events of a daily NDJSON log.
+
+    Each line is an event. The session, type and timestamp that event files
+    carry in their name are taken from the event itself.
+
+    Args:
+    ----
+        file_info: Tuple of (path, size_bytes, mtime) from _iter_json_files.
+
+    Returns:
+    -------
+        The rows of the events, in line order, as built by _event_row.
 
-        row = {
-            "source_file": str(p),
-            "size_bytes": st.st_size,
-            "mtime_utc": datetime.fromtimestamp(st.st_mtime, UTC).isoformat(),
-            "sessionId": sessionId,
-            "timestamp": timestamp,
-            "eventType": eventType,
-            "canonical_event_type": canonical_event_type,
-            "valid": valid,
-            "validation_error": validation_error,
-            "payload_json": (safe_json_dump(payload) if payload is not None else None),
-            "payload_unknown_json": safe_json_dump(unknown) if unknown else None,
-        }
-        # add known fields as top-level columns
-        for k, v in known.items():
-            # string-ify complex values to keep the table rectangular
-            row[k] = (
-                v
-                if isinstance(v, str | int | float | bool) or v is None
-                else safe_json_dump(v)
+    """
+    path_str = file_info[0]
+    fallback_session = f"unknown-{Path(path_str).parent.name}"
+    try:
+        with open(path_str, "rb") as f:
+            lines = f.read().splitlines()
+    except OSError as e:
+        return [_error_row(file_info, fallback_session, None, "other", e)]
+    rows = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            decoded = _decode(line)
+        except Exception as e:
+            rows.append(_error_row(file_info, fallback_session, None, "other", e))
+            continue
+        doc, ev, _ = decoded
+        fields = doc if isinstance(doc, dict) else {}
+        session = fields.get("sessionId") or getattr(ev, "sessionId", None)
+        event_type = fields.get("eventType") or getattr(ev, "eventType", None)
+        timestamp = fields.get("timestamp") or getattr(ev, "timestamp", None)
+        rows.append(
+            _event_row(
+                file_info,
+                str(session or fallback_session),
+                None,
+                str(event_type or "other"),
+                decoded,
+                timestamp,
             )
-        rows.append(row)
+        )
     return rows
 
 
-# The function is too complex, we have to break it down someday
-def write_outputs(rows: list[dict[str, Any]], out_prefix: Path) -> None:  # noqa: C901
+def _process_file(file_info: tuple[str, int, float]) -> list[Row]:
+    """
+    Load, validate and normalize a monitor event file or daily NDJSON log.
+
+    Args:
+    ----
+        file_info: Tuple of (path, size_bytes, mtime) from _iter_json_files.
+
+    Returns:
+    -------
+        The rows of the events of the file, as built by _event_row: one for
+        an event file, one per line for a daily log.
+
+    """
+    path_str, size_bytes, _ = file_info
+    if path_str.endswith(".ndjson"):
+        return _process_ndjson_file(file_info)
+    p = Path(path_str)
+    key_f, ts_f, type_f = parse_filename(p.name)
+    type_f = type_f or "other"
+    sessionId = key_f or f"unknown-{p.parent.name}"
+    try:
+        with _json_buffer(path_str, size_bytes) as data:
+            decoded = _decode(data)
+    except Exception as e:
+        return [_error_row(file_info, sessionId, ts_f, type_f, e)]
+    return [_event_row(file_info, sessionId, ts_f, type_f, decoded)]
+
+
+def walk_and_collect(
+    root: Path,
+    schema_path: Path | None = None,
+    use_msgspec: bool = False,
+    trust_input: bool = False,
+    max_workers: int | None = None,
+) -> dict[str, list[Any]]:
+    """
+    Walk directory tree and collect all monitor events.
+
+    Files are parsed and validated in a process pool, since the per-file
+    work is independent and CPU bound. Rows are gathered column by column,
+    ready to build an Arrow table without going through pandas.
+
+    Args:
+    ----
+        root: Root directory to search for JSON files.
+        schema_path: Optional path to the Pydantic schema file for validation.
+        use_msgspec: Validate with MonitorEventStruct instead of the schema.
+        trust_input: Build schema instances with model_construct, skipping validation.
+        max_workers: Number of worker processes (default: all cores).
+
+    Returns:
+    -------
+        Dictionary mapping column names to lists of normalized event data,
+        with None where an event lacks the column.
+
+    """
+    files = _iter_json_files(root)
+    if not files:
+        return {}
+    fixed: list[list[Any]] = [[] for _ in ROW_COLUMNS]
+    extra_cols: dict[str, list[Any]] = {}
+    n_rows = 0
+    with ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(schema_path, use_msgspec, trust_input),
+    ) as pool:
+        for rows in pool.map(_process_file, files, chunksize=64):
+            for values, extra in rows:
+                for col, v in zip(fixed, values, strict=True):
+                    col.append(v)
+                for k, v in extra.items():
+                    col = extra_cols.setdefault(k, [])
+                    col.extend([None] * (n_rows - len(col)))
+                    col.append(v)
+                n_rows += 1
+    for col in extra_cols.values():
+        col.extend([None] * (n_rows - len(col)))
+    return dict(zip(ROW_COLUMNS, fixed, strict=True)) | extra_cols
+
+
+def _normalize_timestamps(columns: dict[str, list[Any]]) -> None:
+    """
+    Normalize event timestamps and file modification times to UTC.
+
+    Parsing and formatting are done in vectorized pandas passes over whole
+    columns rather than per event. The event's own timestamp is preferred,
+    then the one from the filename, then the file modification time.
+
+    Args:
+    ----
+        columns: Collected columns, modified in place. The raw event
+            timestamp column is consumed, mtime_utc epochs become datetimes.
+
+    """
+    n_rows = len(columns["timestamp"])
+    raw_series = pd.Series(columns.pop(EVENT_TS_COL, [None] * n_rows), dtype=object)
+    parsed = pd.to_datetime(raw_series, utc=True, errors="coerce", format="ISO8601")
+    # The monitor writes compact timestamps such as 20250710T091503931Z
+    compact = pd.to_datetime(
+        raw_series, utc=True, errors="coerce", format="%Y%m%dT%H%M%S%fZ"
+    )
+    parsed = parsed.fillna(compact)
+    mtime = pd.to_datetime(
+        pd.Series(columns["mtime_utc"], dtype="float64"), unit="s", utc=True
+    ).dt.round("us")
+    fallback = pd.Series(columns["timestamp"], dtype=object)
+    fallback = fallback.fillna(mtime.dt.strftime(TIMESTAMP_FORMAT))
+    formatted = parsed.dt.strftime(TIMESTAMP_FORMAT)
+    columns["timestamp"] = formatted.where(parsed.notna(), fallback).tolist()
+    columns["mtime_utc"] = mtime.tolist()
+
+
+# Arrow type of a column by the set of Python types of its non-null values
+ARROW_TYPES: dict[frozenset[type], pa.DataType] = {
+    frozenset(): pa.null(),
+    frozenset({str}): pa.string(),
+    frozenset({bool}): pa.bool_(),
+    frozenset({int}): pa.int64(),
+    frozenset({float}): pa.float64(),
+    frozenset({int, float}): pa.float64(),
+    frozenset({pd.Timestamp}): pa.timestamp("us", tz="UTC"),
+}
+
+
+def _arrow_schema(columns: dict[str, list[Any]], names: list[str]) -> pa.Schema:
     """
-    Write collected rows to CSV, Parquet, and Markdown summary.
+    Infer the output schema from the Python types found in each column.
+
+    Unlike pyarrow's sampling inference, every value is looked at, so the
+    schema holds for all row groups. Mixed columns are stored as strings.
 
     Args:
     ----
-        rows: List of event dictionaries to write.
+        columns: Collected columns.
+        names: Names of the columns to include, in order.
+
+    Returns:
+    -------
+        The Arrow schema of the output table.
+
+    """
+    fields = []
+    for name in names:
+        kinds = set(map(type, columns[name])) - {type(None)}
+        arrow_type = ARROW_TYPES.get(frozenset(kinds), pa.string())
+        if name in CATEGORICAL_COLUMNS:
+            arrow_type = pa.dictionary(pa.int32(), pa.string())
+        fields.append(pa.field(name, arrow_type))
+    return pa.schema(fields)
+
+
+def _to_arrow(values: list[Any], arrow_type: pa.DataType) -> pa.Array:
+    """
+    Convert column values to an Arrow array, as strings if they are mixed.
+
+    Args:
+    ----
+        values: Column values.
+        arrow_type: Type of the column, from _arrow_schema.
+
+    Returns:
+    -------
+        An Arrow array of the given type.
+
+    """
+    try:
+        return pa.array(values, type=arrow_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([None if v is None else str(v) for v in values], arrow_type)
+
+
+def _write_tables(
+    columns: dict[str, list[Any]],
+    schema: pa.Schema,
+    csv_path: Path | None,
+    pq_path: Path | None,
+    arrow_path: Path | None = None,
+) -> None:
+    """
+    Write columns to CSV, Parquet and/or Arrow IPC, one row group at a time.
+
+    Only one batch of Arrow buffers exists at any time, so the Arrow copy
+    of the data does not double the peak memory.
+
+    Args:
+    ----
+        columns: Collected columns.
+        schema: Output schema, from _arrow_schema.
+        csv_path: Where to write the CSV file, or None.
+        pq_path: Where to write the Parquet file, or None.
+        arrow_path: Where to write the Arrow IPC file, or None.
+
+    """
+    writers: list[Any] = []
+    if csv_path:
+        writers.append(pacsv.CSVWriter(csv_path, schema))
+    if pq_path:
+        writers.append(
+            pq.ParquetWriter(pq_path, schema, compression="zstd", compression_level=3)
+        )
+    if arrow_path:
+        # uncompressed, so that readers can memory-map it without decoding
+        writers.append(pa.ipc.new_file(arrow_path, schema))
+    n_rows = len(columns[schema.names[0]])
+    try:
+        for start in range(0, n_rows, ROW_GROUP_SIZE):
+            stop = start + ROW_GROUP_SIZE
+            batch = pa.record_batch(
+                [_to_arrow(columns[f.name][start:stop], f.type) for f in schema],
+                schema=schema,
+            )
+            for writer in writers:
+                writer.write_batch(batch)
+    finally:
+        for writer in writers:
+            writer.close()
+
+
+def write_outputs(
+    columns: dict[str, list[Any]],
+    out_prefix: Path,
+    write_csv: bool = False,
+    write_parquet: bool = True,
+    write_arrow: bool = False,
+) -> None:
+    """
+    Write collected columns to Parquet, optionally CSV/Arrow, and Markdown summary.
+
+    Args:
+    ----
+        columns: Dictionary of column name to event values, as from walk_and_collect.
         out_prefix: Output file path prefix (without extension).
+        write_csv: Also write a CSV file, larger and slower than Parquet.
+        write_parquet: Write the ZSTD-compressed Parquet file.
+        write_arrow: Also write an Arrow IPC (Feather v2) file, larger than
+            Parquet but loaded by the dashboard without decoding.
 
     """
-    if not rows:
+    if not columns:
         logger.info("No JSON files found.")
         return
-
-    df = pd.DataFrame(rows)
+    _normalize_timestamps(columns)
 
     # Ensure stable column order: essentials first
     base_cols = [
@@ -328,36 +903,91 @@ def write_outputs(rows: list[dict[str, Any]], out_prefix: Path) -> None:  # noqa
         "size_bytes",
         "mtime_utc",
     ]
-    cols = [c for c in base_cols if c in df.columns] + [
-        c for c in df.columns if c not in base_cols
+    cols = [c for c in base_cols if c in columns] + [
+        c for c in columns if c not in base_cols
     ]
-    df = df.reindex(columns=cols)
+    schema = _arrow_schema(columns, cols)
 
     csv_path = out_prefix.with_suffix(".csv")
     pq_path = out_prefix.with_suffix(".parquet")
+    arrow_path = out_prefix.with_suffix(".arrow")
     md_path = out_prefix.with_suffix(".md")
 
-    df.to_csv(csv_path, index=False)
-    try:
-        df.to_parquet(pq_path, index=False)
-        parquet_note = f"Wrote Parquet to {pq_path}"
-    except Exception as e:
-        parquet_note = f"Parquet not written (missing pyarrow/fastparquet?): {e}"
+    _write_tables(
+        columns,
+        schema,
+        csv_path if write_csv else None,
+        pq_path if write_parquet else None,
+        arrow_path if write_arrow else None,
+    )
+    if write_csv:
+        logger.info("Wrote CSV to %s", csv_path)
+    if write_parquet:
+        logger.info("Wrote Parquet to %s", pq_path)
+    if write_arrow:
+        logger.info("Wrote Arrow IPC to %s", arrow_path)
+
+    _write_summary(columns, schema, md_path)
+    logger.info("Wrote markdown summary to %s", md_path)
+
 
-    # Quick markdown summary
+def _value_counts(
+    values: pa.Array, none_label: str | None, limit: int | None = None
+) -> list[tuple[Any, int]]:
+    """
+    Count distinct values with Arrow compute, most frequent first.
+
+    Args:
+    ----
+        values: Column to count.
+        none_label: Label for missing values, or None to leave them out.
+        limit: Maximum number of values to return.
+
+    Returns:
+    -------
+        List of (value, count) tuples.
+
+    """
+    counts = pc.value_counts(values)
+    pairs = [
+        (none_label if v is None else v, n)
+        for v, n in zip(
+            counts.field("values").to_pylist(),
+            counts.field("counts").to_pylist(),
+            strict=True,
+        )
+        if v is not None or none_label is not None
+    ]
+    # stable sort: ties keep their order of first appearance
+    pairs.sort(key=lambda pair: -pair[1])
+    return pairs[:limit]
+
+
+def _write_summary(
+    columns: dict[str, list[Any]], schema: pa.Schema, md_path: Path
+) -> None:
+    """
+    Write a quick markdown summary of the collected events.
+
+    Args:
+    ----
+        columns: Collected columns.
+        schema: Output schema, from _arrow_schema.
+        md_path: Where to write the markdown file.
+
+    """
     lines = []
     lines.append("# Monitor logs summary\n")
-    lines.append(f"- Rows: {len(df)}")
-    has_validation = (
-        "canonical_event_type" in df.columns
-        and df["canonical_event_type"].notna().any()
+    lines.append(f"- Rows: {len(columns[schema.names[0]])}")
+    has_validation = "canonical_event_type" in columns and any(
+        v is not None for v in columns["canonical_event_type"]
     )
     lines.append(f"- Validated with schema: {has_validation}")
     lines.append("")
 
     # Check if tabulate is available for markdown tables
     try:
-        import tabulate  # noqa: F401
+        from tabulate import tabulate
 
         use_markdown = True
     except ImportError:
@@ -366,54 +996,32 @@ def write_outputs(rows: list[dict[str, Any]], out_prefix: Path) -> None:  # noqa
             "tabulate not installed - writing plain text tables instead of markdown"
         )
 
-    if "canonical_event_type" in df.columns:
-        lines.append("## Events by canonical_event_type")
-        counts = df["canonical_event_type"].fillna("(none)").value_counts()
-        if use_markdown:
-            lines.append(counts.to_markdown())
-        else:
-            lines.append(counts.to_string())
-        lines.append("")
-
-    if "eventType" in df.columns:
-        lines.append("## Events by filename eventType")
-        counts = df["eventType"].fillna("(none)").value_counts()
+    sections = [
+        ("canonical_event_type", "Events by canonical_event_type", "(none)", None),
+        ("eventType", "Events by filename eventType", "(none)", None),
+        ("query", "Top queries", None, 20),
+        ("validation_error", "Validation errors (top 10)", None, 10),
+    ]
+    for column, title, none_label, limit in sections:
+        if column not in columns:
+            continue
+        values = _to_arrow(columns[column], schema.field(column).type)
+        counts = _value_counts(values, none_label, limit)
+        if not counts:
+            continue
+        lines.append(f"## {title}")
         if use_markdown:
-            lines.append(counts.to_markdown())
+            lines.append(tabulate(counts, headers=[column, "count"], tablefmt="pipe"))
         else:
-            lines.append(counts.to_string())
+            lines.extend(f"{value}    {count}" for value, count in counts)
         lines.append("")
 
-    if "query" in df.columns:
-        top_q = df["query"].dropna().value_counts().head(20)
-        if not top_q.empty:
-            lines.append("## Top queries")
-            if use_markdown:
-                lines.append(top_q.to_markdown())
-            else:
-                lines.append(top_q.to_string())
-            lines.append("")
-
-    if "validation_error" in df.columns:
-        err_counts = df["validation_error"].dropna().value_counts().head(10)
-        if not err_counts.empty:
-            lines.append("## Validation errors (top 10)")
-            if use_markdown:
-                lines.append(err_counts.to_markdown())
-            else:
-                lines.append(err_counts.to_string())
-            lines.append("")
-
     with open(md_path, "w", encoding="utf-8") as f:
         f.write("\n".join(lines))
 
-    logger.info("Wrote CSV to %s", csv_path)
-    logger.info("%s", parquet_note)
-    logger.info("Wrote markdown summary to %s", md_path)
-
 
 def main() -> None:
-    """Load monitor logs, validate, normalize, and export to CSV/Parquet/Markdown."""
+    """Load monitor logs, validate, normalize, and export to Parquet/CSV/Markdown."""
     ap = argparse.ArgumentParser()
     ap.add_argument("root", type=Path, help="Path to the monitor-logs root directory")
     ap.add_argument(
@@ -422,22 +1030,57 @@ def main() -> None:
         default=None,
         help="Path to the Pydantic schema file (with MonitorEvent)",
     )
+    ap.add_argument(
+        "--msgspec",
+        action="store_true",
+        help="Validate with the built-in msgspec struct instead of --schema (faster)",
+    )
+    ap.add_argument(
+        "--trust-input",
+        action="store_true",
+        help=(
+            "Skip --schema validation for logs written by our own monitor; "
+            "events with all required fields but wrong values are then not "
+            "reported as validation errors"
+        ),
+    )
     ap.add_argument(
         "--out",
         type=Path,
         default=Path("monitor_analysis"),
         help="Output file prefix (no extension)",
     )
+    ap.add_argument("--csv", action="store_true", help="Also write a CSV file")
+    ap.add_argument(
+        "--no-parquet", action="store_true", help="Do not write the Parquet file"
+    )
+    ap.add_argument(
+        "--arrow",
+        action="store_true",
+        help="Also write an Arrow IPC file, the fastest to load in the dashboard",
+    )
     args = ap.parse_args()
 
-    MonitorEvent = None
-    if args.schema:
-        MonitorEvent, _ = load_monitor_schema(args.schema)
+    schema_path = args.schema
+    if schema_path:
+        MonitorEvent, _ = load_monitor_schema(schema_path)
         if MonitorEvent is None:
             logger.warning("Proceeding without validation (schema import failed).")
+            schema_path = None
 
-    rows = walk_and_collect(args.root, MonitorEvent=MonitorEvent)
-    write_outputs(rows, args.out)
+    columns = walk_and_collect(
+        args.root,
+        schema_path=schema_path,
+        use_msgspec=args.msgspec,
+        trust_input=args.trust_input,
+    )
+    write_outputs(
+        columns,
+        args.out,
+        write_csv=args.csv,
+        write_parquet=not args.no_parquet,
+        write_arrow=args.arrow,
+    )
 
 
 if __name__ == "__main__":
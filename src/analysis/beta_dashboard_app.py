@@ -3,7 +3,7 @@
 beta_dashboard_app.py — Interactive dashboard for CIRED.digital beta analysis.
 
 Usage:
-    streamlit run beta_dashboard_app.py -- --config analysis_config.yaml --csv monitor_analysis.csv
+    streamlit run beta_dashboard_app.py -- --config analysis_config.yaml --data monitor_analysis.parquet
 
 Features:
     - Executive KPI dashboard
@@ -14,116 +14,378 @@ Features:
 
 import argparse
 import re
-from datetime import datetime
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo
 
+import duckdb
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import streamlit as st
 import yaml
 
-
-def load_config(config_path: Path) -> dict[str, Any]:
-    """Load configuration from YAML file."""
+# Arrow string types kept Arrow-backed when converting to pandas
+ARROW_STRING_TYPES = {
+    pa.string(): pd.ArrowDtype(pa.string()),
+    pa.large_string(): pd.ArrowDtype(pa.large_string()),
+}
+
+# Exclusion config keys holding regexes, by the column they are matched against
+EXCLUSION_REGEX_KEYS = {
+    "source_file": "source_file_regex_any",
+    "query": "query_regex_any",
+    "payload_unknown_json": "payload_useragent_regex_any",
+}
+# String columns with many repeated values, grouped and counted by the dashboard
+CATEGORY_COLUMNS = ["sessionId", "query", "payload_json"]
+# Session histograms: bucket edges (in minutes / events) and labels
+DURATION_BUCKET_EDGES = np.array([0, 1, 3, 5, 10, 30, np.inf])
+DURATION_BUCKET_LABELS = [
+    "<1 min",
+    "1-3 min",
+    "3-5 min",
+    "5-10 min",
+    "10-30 min",
+    ">30 min",
+]
+DEPTH_BUCKET_EDGES = np.array([0, 2, 5, 10, 20, np.inf])
+DEPTH_BUCKET_LABELS = ["0-2", "3-5", "6-10", "11-20", ">20"]
+
+# Rows of the top publications/queries tables
+TOP_N = 20
+
+# Columns read by the time filter, exclusions and session metrics
+FILTER_COLUMNS = [
+    "timestamp",
+    "sessionId",
+    "source_file",
+    "query",
+    "comment",
+    "payload_unknown_json",
+]
+INLINE_FLAGS_RE = re.compile(r"\(\?[iLmsux]+\)")
+
+
+@st.cache_resource
+def load_config(config_path: Path, mtime_ns: int) -> dict[str, Any]:
+    """
+    Load configuration from YAML file.
+
+    Parsed once per file version and shared by all reruns and sessions, so
+    it must not be modified.
+    """
     with open(config_path, encoding="utf-8") as f:
         config: dict[str, Any] = yaml.safe_load(f)
         return config
 
 
-def load_data(parquet_path: Path) -> pd.DataFrame:
-    """Load and prepare data from Parquet file."""
-    df = pd.read_parquet(parquet_path)
-    df["timestamp"] = pd.to_datetime(df["timestamp"], format="ISO8601", utc=True)
-    return df
+@st.cache_resource(show_spinner="Loading data...")
+def load_table(data_path: Path, mtime_ns: int) -> pa.Table:
+    """
+    Load the events from a Parquet or Arrow IPC (Feather) file.
+
+    Arrow IPC files are memory-mapped and need no decoding. The table is
+    kept as is, shared by all reruns and sessions, and only the filtered rows
+    are converted to pandas by prepare_data.
+
+    The file modification time is only used as part of the cache key, so that
+    a regenerated dataset is reloaded.
+    """
+    if data_path.suffix in (".arrow", ".feather"):
+        with pa.memory_map(str(data_path)) as source:
+            table = pa.ipc.open_file(source).read_all()
+    else:
+        table = pq.read_table(data_path)
+    # Parse the ISO 8601 timestamps once per file
+    timestamps = pd.to_datetime(
+        table.column("timestamp").to_pandas(), format="ISO8601", utc=True
+    )
+    return table.set_column(
+        table.schema.get_field_index("timestamp"),
+        "timestamp",
+        pa.Array.from_pandas(timestamps),
+    )
 
 
-def apply_time_filter(
-    df: pd.DataFrame, config: dict[str, Any], include_spillover: bool
-) -> pd.DataFrame:
-    """Apply time window filter based on config."""
+def beta_period(config: dict[str, Any]) -> tuple[datetime, datetime]:
+    """Return the first and last instants of the beta period, in UTC."""
     tz = ZoneInfo(config["time"]["timezone"])
     start_date = datetime.fromisoformat(str(config["time"]["start"])).replace(tzinfo=tz)
     end_date = datetime.fromisoformat(str(config["time"]["end"])).replace(
         hour=23, minute=59, second=59, tzinfo=tz
     )
+    return start_date.astimezone(UTC), end_date.astimezone(UTC)
 
-    df["local_dt"] = df["timestamp"].dt.tz_convert(tz)
-    df["is_beta_period"] = (df["local_dt"] >= start_date) & (df["local_dt"] <= end_date)
 
-    if include_spillover:
-        session_starts = df[df["is_beta_period"]].groupby("sessionId")["local_dt"].min()
-        beta_sessions = set(session_starts.index)
-        return df[df["sessionId"].isin(beta_sessions)].copy()
-    else:
-        return df[df["is_beta_period"]].copy()
+def exclusion_patterns(exclusions: dict[str, Any]) -> dict[str, str]:
+    """
+    Combine the exclusion regexes of each column into a single alternation.
+
+    Inline flags such as ``(?i)`` are stripped, matching is case-insensitive.
+    """
+    patterns = {}
+    for column, key in EXCLUSION_REGEX_KEYS.items():
+        cleaned = [INLINE_FLAGS_RE.sub("", p) for p in exclusions.get(key, [])]
+        if cleaned:
+            patterns[column] = "|".join(f"(?:{p})" for p in cleaned)
+    return patterns
 
 
-def apply_exclusions(df: pd.DataFrame, config: dict[str, Any]) -> pd.DataFrame:
-    """Apply exclusion rules for dev/test traffic and bots."""
+def exclusion_expr(config: dict[str, Any]) -> pl.Expr:
+    """Build the expression flagging dev/test traffic and bots."""
     exclusions = config.get("exclusions", {})
-    df["is_excluded"] = False
+    excluded = pl.lit(False)
 
     for prefix in exclusions.get("dev_session_prefixes", []):
-        df.loc[df["sessionId"].str.startswith(prefix, na=False), "is_excluded"] = True
-
-    for pattern in exclusions.get("source_file_regex_any", []):
-        clean_pattern = re.sub(r"\(\?[iLmsux]+\)", "", pattern)
-        df.loc[
-            df["source_file"].str.contains(
-                clean_pattern, case=False, na=False, regex=True
-            ),
-            "is_excluded",
-        ] = True
-
-    for pattern in exclusions.get("query_regex_any", []):
-        clean_pattern = re.sub(r"\(\?[iLmsux]+\)", "", pattern)
-        df.loc[
-            df["query"].str.contains(clean_pattern, case=False, na=False, regex=True),
-            "is_excluded",
-        ] = True
-
-    for pattern in exclusions.get("payload_useragent_regex_any", []):
-        clean_pattern = re.sub(r"\(\?[iLmsux]+\)", "", pattern)
-        df.loc[
-            df["payload_unknown_json"].str.contains(
-                clean_pattern, case=False, na=False, regex=True
-            ),
-            "is_excluded",
-        ] = True
-
-    return df[~df["is_excluded"]].copy()
-
-
-def compute_session_metrics(df: pd.DataFrame) -> pd.DataFrame:
+        excluded |= pl.col("sessionId").str.starts_with(prefix).fill_null(False)
+
+    # One vectorized regex pass per column, run by Polars on its own thread
+    # pool outside the GIL
+    for column, pattern in exclusion_patterns(exclusions).items():
+        excluded |= pl.col(column).str.contains(f"(?i){pattern}").fill_null(False)
+
+    return excluded
+
+
+def to_polars(df: pd.DataFrame, columns: list[str]) -> pl.DataFrame:
+    """Convert the given columns of a pandas frame to Polars for aggregation."""
+    # Categorical ordering semantics differ across Polars versions: use strings
+    return pl.from_pandas(df[columns]).with_columns(
+        pl.col(pl.Categorical).cast(pl.String)
+    )
+
+
+def top_values(values: pd.Series, n: int) -> pd.Series:
+    """Count the most frequent values, leaving out unused categories."""
+    counts = values.value_counts()
+    return counts[counts > 0].head(n)
+
+
+def top_value_tables(
+    df: pd.DataFrame, masks: dict[str, pd.Series], use_duckdb: bool = False
+) -> dict[str, pd.Series]:
+    """
+    Count the most viewed publications and the most frequent queries.
+
+    Returns the TOP_N value counts of each table, most frequent first,
+    computed with pandas or with a single DuckDB query.
+    """
+    if use_duckdb:
+        return top_value_tables_duckdb(df, masks)
+    return {
+        "articles": top_values(df.loc[masks["article"], "payload_json"], TOP_N),
+        "queries": top_values(df.loc[masks["query"], "query"], TOP_N),
+        "zero_result_queries": top_values(
+            df.loc[masks["query"] & ~masks["response"], "query"], TOP_N
+        ),
+    }
+
+
+def top_value_tables_duckdb(
+    df: pd.DataFrame, masks: dict[str, pd.Series]
+) -> dict[str, pd.Series]:
+    """Compute top_value_tables in one DuckDB query returning only the top rows."""
+    events = pd.DataFrame(
+        {
+            "payload_json": df["payload_json"],
+            "query": df["query"],
+            "is_article": masks["article"],
+            "has_query": masks["query"],
+            "has_response": masks["response"],
+        }
+    )
+    con = duckdb.connect()
+    try:
+        con.register("events", events)
+        top = con.execute(
+            """
+            WITH counts AS (
+                SELECT 'articles' AS tbl, payload_json::VARCHAR AS value, count(*) AS n
+                FROM events WHERE is_article AND payload_json IS NOT NULL
+                GROUP BY ALL
+                UNION ALL
+                SELECT 'queries', query::VARCHAR, count(*)
+                FROM events WHERE has_query
+                GROUP BY ALL
+                UNION ALL
+                SELECT 'zero_result_queries', query::VARCHAR, count(*)
+                FROM events WHERE has_query AND NOT has_response
+                GROUP BY ALL
+            )
+            SELECT * FROM counts
+            QUALIFY row_number() OVER (PARTITION BY tbl ORDER BY n DESC, value) <= ?
+            ORDER BY tbl, n DESC, value
+            """,
+            [TOP_N],
+        ).df()
+    finally:
+        con.close()
+    return {
+        name: pd.Series(
+            rows["n"].to_numpy(), index=pd.Index(rows["value"], name=name), name="count"
+        )
+        for name, rows in (
+            (name, top[top["tbl"] == name])
+            for name in ("articles", "queries", "zero_result_queries")
+        )
+    }
+
+
+def compute_session_metrics(events: pl.LazyFrame) -> pd.DataFrame:
     """Compute session-level metrics."""
-    session_data = []
-
-    for session_id, group in df.groupby("sessionId"):
-        first_event = group["local_dt"].min()
-        last_event = group["local_dt"].max()
-        duration_sec = (last_event - first_event).total_seconds()
-
-        duration_sec = max(0, min(duration_sec, 8 * 3600))
-
-        session_data.append(
-            {
-                "sessionId": session_id,
-                "start_time": first_event,
-                "end_time": last_event,
-                "duration_sec": duration_sec,
-                "event_count": len(group),
-                "query_count": group["query"].notna().sum(),
-                "has_feedback": group["comment"].notna().any(),
-            }
+    session_df = (
+        events.filter(pl.col("sessionId").is_not_null())
+        .group_by("sessionId")
+        .agg(
+            start_time=pl.col("local_dt").min(),
+            end_time=pl.col("local_dt").max(),
+            event_count=pl.len().cast(pl.Int64),
+            query_count=pl.col("query").is_not_null().sum().cast(pl.Int64),
+            has_feedback=pl.col("comment").is_not_null().any(),
+        )
+        .with_columns(
+            duration_sec=(
+                (pl.col("end_time") - pl.col("start_time")).dt.total_microseconds()
+                / 1e6
+            ).clip(0, 8 * 3600)
         )
+        .select(
+            "sessionId",
+            "start_time",
+            "end_time",
+            "duration_sec",
+            "event_count",
+            "query_count",
+            "has_feedback",
+        )
+        .sort("sessionId")
+        .collect()
+    )
+    return session_df.to_pandas()
 
-    return pd.DataFrame(session_data)
+
+def event_masks(df: pd.DataFrame) -> dict[str, pd.Series]:
+    """Compute the row masks shared by several dashboard tabs."""
+    return {
+        "query": df["query"].notna(),
+        "response": df["response"].notna(),
+        "article": df["eventType"] == "article",
+        "request": df["eventType"] == "request",
+    }
 
 
-def render_executive_dashboard(df: pd.DataFrame, session_df: pd.DataFrame) -> None:
+@st.cache_data(show_spinner="Filtering events...")
+def prepare_data(
+    data_path: Path,
+    mtime_ns: int,
+    config: dict[str, Any],
+    include_spillover: bool,
+    use_duckdb: bool = False,
+) -> tuple[
+    dict[str, int],
+    pd.DataFrame,
+    pd.DataFrame,
+    dict[str, pd.Series],
+    dict[str, pd.Series],
+]:
+    """
+    Load, filter and aggregate the events shown by the dashboard.
+
+    Cached on the file, config and spillover setting rather than on a
+    DataFrame, so widget interactions do not redo the filtering passes.
+
+    The time window, exclusions and session metrics are evaluated together
+    by Polars on the few columns they need, and only the kept rows are
+    converted to pandas. Strings stay Arrow-backed, so string matching uses
+    Arrow kernels, and repeated strings become categoricals.
+
+    Returns the event counts after each filtering step, the filtered events,
+    the session metrics, the event masks shared by the tabs and the top
+    publications/queries tables.
+    """
+    table = load_table(data_path, mtime_ns)
+    tz_name = config["time"]["timezone"]
+    start_date, end_date = beta_period(config)
+    exclude_bots = config.get("exclusions", {}).get("exclude_bots", True)
+
+    is_beta_period = pl.col("timestamp").is_between(start_date, end_date)
+    # With spillover, keep every event of the sessions seen during the period
+    in_window = (
+        is_beta_period.any().over("sessionId") if include_spillover else is_beta_period
+    )
+    excluded = exclusion_expr(config) if exclude_bots else pl.lit(False)
+    events = (
+        pl.DataFrame(table.select(FILTER_COLUMNS))
+        .lazy()
+        .with_columns(
+            local_dt=pl.col("timestamp").dt.convert_time_zone(tz_name),
+            is_beta_period=is_beta_period,
+            in_window=in_window,
+            excluded=excluded,
+        )
+        .collect()
+    )
+
+    counts = {
+        "Total Events (Raw)": table.num_rows,
+        "Events After Time Filter": int(events["in_window"].sum()),
+    }
+    keep = events["in_window"] & ~events["excluded"]
+    if exclude_bots:
+        counts["Events After Exclusions"] = int(keep.sum())
+
+    session_df = compute_session_metrics(events.lazy().filter(keep))
+
+    df: pd.DataFrame = table.filter(keep.to_arrow()).to_pandas(
+        types_mapper=ARROW_STRING_TYPES.get
+    )
+    # Repeated strings: hash and compare small integer codes
+    for col in CATEGORY_COLUMNS:
+        df[col] = df[col].astype("category")
+    df["local_dt"] = df["timestamp"].dt.tz_convert(tz_name)
+    df["is_beta_period"] = events["is_beta_period"].filter(keep).to_numpy()
+    if exclude_bots:
+        df["is_excluded"] = False
+    masks = event_masks(df)
+    tops = top_value_tables(df, masks, use_duckdb)
+    return counts, df, session_df, masks, tops
+
+
+def query_success_rate(sessions: pd.Series, masks: dict[str, pd.Series]) -> float:
+    """
+    Percentage of the sessions with a query that also got a response.
+
+    Works on the integer codes of the categorical session ids with Arrow
+    kernels, without building intermediate frames.
+    """
+    codes = pa.array(sessions.cat.codes)
+    query_sessions = pc.unique(pc.filter(codes, pa.array(masks["query"])))
+    if len(query_sessions) == 0:
+        return 0
+    # code -1 marks a missing session id, never counted as answered
+    answered = pc.and_(
+        pc.and_(pc.is_in(codes, value_set=query_sessions), pa.array(masks["response"])),
+        pc.greater_equal(codes, 0),
+    )
+    answered_sessions = pc.count_distinct(pc.filter(codes, answered)).as_py()
+    return float(answered_sessions / len(query_sessions) * 100)
+
+
+@st.fragment
+def render_executive_dashboard(
+    df: pd.DataFrame,
+    session_df: pd.DataFrame,
+    masks: dict[str, pd.Series],
+    tops: dict[str, pd.Series],
+) -> None:
     """Render executive KPI dashboard."""
     st.header("Executive Dashboard")
 
@@ -133,19 +395,11 @@ def render_executive_dashboard(df: pd.DataFrame, session_df: pd.DataFrame) -> No
         st.metric("Unique Sessions", len(session_df))
 
     with col2:
-        total_queries = df["query"].notna().sum()
+        total_queries = masks["query"].sum()
         st.metric("Total Queries", total_queries)
 
     with col3:
-        query_sessions = df[df["query"].notna()]["sessionId"].unique()
-        sessions_with_response = df[
-            df["sessionId"].isin(query_sessions) & df["response"].notna()
-        ]["sessionId"].nunique()
-        success_rate = (
-            (sessions_with_response / len(query_sessions) * 100)
-            if len(query_sessions) > 0
-            else 0
-        )
+        success_rate = query_success_rate(df["sessionId"], masks)
         st.metric("Query Success Rate", f"{success_rate:.1f}%")
 
     with col4:
@@ -184,9 +438,8 @@ def render_executive_dashboard(df: pd.DataFrame, session_df: pd.DataFrame) -> No
     st.plotly_chart(fig, use_container_width=True)
 
     st.subheader("Top Publications by Investigation")
-    article_events = df[df["eventType"] == "article"]
-    if not article_events.empty:
-        top_articles = article_events["payload_json"].value_counts().head(10)
+    if masks["article"].any():
+        top_articles = tops["articles"].head(10)
         if not top_articles.empty:
             st.dataframe(
                 pd.DataFrame(
@@ -198,7 +451,21 @@ def render_executive_dashboard(df: pd.DataFrame, session_df: pd.DataFrame) -> No
         st.info("No article investigation data available")
 
 
-def render_traffic_engagement(df: pd.DataFrame, session_df: pd.DataFrame) -> None:
+def bucket_counts(values: pd.Series, edges: np.ndarray) -> np.ndarray:
+    """
+    Count values in each (edges[i], edges[i + 1]] bucket, as pd.cut bins them.
+
+    Missing values and values outside the edges are not counted.
+    """
+    index = np.searchsorted(edges, values.to_numpy(dtype=float), side="left")
+    inside = (index > 0) & (index < len(edges))
+    return np.bincount(index[inside] - 1, minlength=len(edges) - 1)
+
+
+@st.fragment
+def render_traffic_engagement(
+    session_df: pd.DataFrame, masks: dict[str, pd.Series]
+) -> None:
     """Render traffic and engagement analysis."""
     st.header("Traffic & Engagement")
 
@@ -206,17 +473,13 @@ def render_traffic_engagement(df: pd.DataFrame, session_df: pd.DataFrame) -> Non
 
     with col1:
         st.subheader("Visit Length Distribution")
-        session_df["duration_min"] = session_df["duration_sec"] / 60
-        session_df["duration_bucket"] = pd.cut(
-            session_df["duration_min"],
-            bins=[0, 1, 3, 5, 10, 30, float("inf")],
-            labels=["<1 min", "1-3 min", "3-5 min", "5-10 min", "10-30 min", ">30 min"],
+        duration_counts = bucket_counts(
+            session_df["duration_sec"] / 60, DURATION_BUCKET_EDGES
         )
-        duration_counts = session_df["duration_bucket"].value_counts().sort_index()
 
         fig = px.bar(
-            x=duration_counts.index.astype(str),
-            y=duration_counts.values,
+            x=DURATION_BUCKET_LABELS,
+            y=duration_counts,
             labels={"x": "Duration", "y": "Sessions"},
             title="Session Duration Distribution",
         )
@@ -224,16 +487,11 @@ def render_traffic_engagement(df: pd.DataFrame, session_df: pd.DataFrame) -> Non
 
     with col2:
         st.subheader("Visit Depth Distribution")
-        session_df["depth_bucket"] = pd.cut(
-            session_df["event_count"],
-            bins=[0, 2, 5, 10, 20, float("inf")],
-            labels=["0-2", "3-5", "6-10", "11-20", ">20"],
-        )
-        depth_counts = session_df["depth_bucket"].value_counts().sort_index()
+        depth_counts = bucket_counts(session_df["event_count"], DEPTH_BUCKET_EDGES)
 
         fig = px.bar(
-            x=depth_counts.index.astype(str),
-            y=depth_counts.values,
+            x=DEPTH_BUCKET_LABELS,
+            y=depth_counts,
             labels={"x": "Events per Session", "y": "Sessions"},
             title="Session Depth Distribution",
         )
@@ -244,9 +502,9 @@ def render_traffic_engagement(df: pd.DataFrame, session_df: pd.DataFrame) -> Non
         "Stage": ["Sessions", "Queries", "Investigations", "Requests"],
         "Count": [
             len(session_df),
-            df["query"].notna().sum(),
-            df[df["eventType"] == "article"].shape[0],
-            df[df["eventType"] == "request"].shape[0],
+            masks["query"].sum(),
+            masks["article"].sum(),
+            masks["request"].sum(),
         ],
     }
     funnel_df = pd.DataFrame(funnel_data)
@@ -262,22 +520,42 @@ def render_traffic_engagement(df: pd.DataFrame, session_df: pd.DataFrame) -> Non
     st.plotly_chart(fig, use_container_width=True)
 
 
-def render_query_intelligence(df: pd.DataFrame) -> None:
-    """Render query intelligence analysis."""
+def search_mask(values: pd.Series, term: str) -> np.ndarray:
+    """
+    Match a literal substring, ignoring case, in a categorical string column.
+
+    Only the distinct values are scanned, with Arrow's match_substring, and
+    the result is spread to the rows through the category codes.
+    """
+    categories = pa.array(values.cat.categories, type=pa.string())
+    matched = pc.match_substring(categories, term, ignore_case=True)
+    # code -1 (missing value) picks the trailing False
+    by_code = np.append(matched.to_numpy(zero_copy_only=False), False)
+    return by_code[values.cat.codes.to_numpy()]
+
+
+@st.fragment
+def render_query_intelligence(
+    df: pd.DataFrame, masks: dict[str, pd.Series], tops: dict[str, pd.Series]
+) -> None:
+    """
+    Render query intelligence analysis.
+
+    Like the other tabs this is a fragment: typing in the search box only
+    reruns this tab.
+    """
     st.header("Query Intelligence")
 
-    queries_df = df[df["query"].notna()][
-        ["local_dt", "query", "sessionId", "response"]
+    queries_df = df.loc[
+        masks["query"], ["local_dt", "query", "sessionId", "response"]
     ].copy()
-    queries_df["has_response"] = queries_df["response"].notna()
+    queries_df["has_response"] = masks["response"][masks["query"]]
 
     st.subheader("Query Explorer")
     search_term = st.text_input("Search queries:", "")
 
     if search_term:
-        filtered_queries = queries_df[
-            queries_df["query"].str.contains(search_term, case=False, na=False)
-        ]
+        filtered_queries = queries_df[search_mask(queries_df["query"], search_term)]
     else:
         filtered_queries = queries_df
 
@@ -290,7 +568,7 @@ def render_query_intelligence(df: pd.DataFrame) -> None:
 
     with col1:
         st.subheader("Top Queries")
-        top_queries = queries_df["query"].value_counts().head(20)
+        top_queries = tops["queries"]
         st.dataframe(
             pd.DataFrame({"Query": top_queries.index, "Count": top_queries.values}),
             use_container_width=True,
@@ -298,9 +576,8 @@ def render_query_intelligence(df: pd.DataFrame) -> None:
 
     with col2:
         st.subheader("Zero-Result Queries")
-        zero_result = queries_df[~queries_df["has_response"]]
-        if not zero_result.empty:
-            zero_counts = zero_result["query"].value_counts().head(20)
+        zero_counts = tops["zero_result_queries"]
+        if not zero_counts.empty:
             st.dataframe(
                 pd.DataFrame({"Query": zero_counts.index, "Count": zero_counts.values}),
                 use_container_width=True,
@@ -309,18 +586,21 @@ def render_query_intelligence(df: pd.DataFrame) -> None:
             st.info("All queries received responses")
 
 
-def render_content_performance(df: pd.DataFrame) -> None:
+@st.fragment
+def render_content_performance(
+    df: pd.DataFrame, masks: dict[str, pd.Series], tops: dict[str, pd.Series]
+) -> None:
     """Render content performance analysis."""
     st.header("Content Performance")
 
-    article_events = df[df["eventType"] == "article"]
+    article_events = df[masks["article"]]
 
     if article_events.empty:
         st.info("No article investigation data available")
         return
 
     st.subheader("Top Publications by Views")
-    top_pubs = article_events["payload_json"].value_counts().head(20)
+    top_pubs = tops["articles"]
 
     fig = px.bar(
         x=top_pubs.values,
@@ -333,31 +613,33 @@ def render_content_performance(df: pd.DataFrame) -> None:
     st.plotly_chart(fig, use_container_width=True)
 
     st.subheader("Co-Access Analysis")
+    # Pairs of distinct articles viewed in the same session, as a self-join
     session_articles = (
-        article_events.groupby("sessionId")["payload_json"].apply(list).reset_index()
+        to_polars(article_events, ["sessionId", "payload_json"])
+        .filter(pl.col("sessionId").is_not_null())
+        .unique()
+    )
+    co_access_counts = (
+        session_articles.join(session_articles, on="sessionId", suffix="_2")
+        .filter(pl.col("payload_json") < pl.col("payload_json_2"))
+        .group_by("payload_json", "payload_json_2")
+        .agg(pl.len().cast(pl.Int64))
+        .sort(
+            ["len", "payload_json", "payload_json_2"],
+            descending=[True, False, False],
+        )
+        .head(10)
     )
 
-    co_access_pairs = []
-    for articles in session_articles["payload_json"]:
-        if len(articles) >= 2:
-            unique_articles = list(set(articles))
-            for i in range(len(unique_articles)):
-                for j in range(i + 1, len(unique_articles)):
-                    pair = tuple(sorted([unique_articles[i], unique_articles[j]]))
-                    co_access_pairs.append(pair)
-
-    if co_access_pairs:
-        co_access_df = pd.DataFrame(co_access_pairs, columns=["Article1", "Article2"])
-        co_access_counts = co_access_df.value_counts().head(10)
-
+    if not co_access_counts.is_empty():
         st.dataframe(
-            pd.DataFrame(
+            co_access_counts.rename(
                 {
-                    "Article 1": [p[0] for p in co_access_counts.index],
-                    "Article 2": [p[1] for p in co_access_counts.index],
-                    "Co-views": co_access_counts.values,
+                    "payload_json": "Article 1",
+                    "payload_json_2": "Article 2",
+                    "len": "Co-views",
                 }
-            ),
+            ).to_pandas(),
             use_container_width=True,
         )
     else:
@@ -383,37 +665,35 @@ def main() -> None:
         "--data",
         type=Path,
         default=Path("data/prepared/monitor_analysis.parquet"),
-        help="Path to Parquet dataset",
+        help="Path to Parquet or Arrow IPC (.arrow, .feather) dataset",
+    )
+    parser.add_argument(
+        "--duckdb",
+        action="store_true",
+        help="Compute the top publications/queries tables with DuckDB",
     )
     args = parser.parse_args()
 
-    config = load_config(args.config)
+    config = load_config(args.config, args.config.stat().st_mtime_ns)
 
     st.title(config.get("export", {}).get("default_report_title", "Beta Dashboard"))
 
     st.sidebar.header("Filters")
 
-    if "df_raw" not in st.session_state:
-        with st.spinner("Loading data..."):
-            st.session_state.df_raw = load_data(args.data)
-
-    df_raw = st.session_state.df_raw
-
     include_spillover = st.sidebar.checkbox(
         "Include spillover sessions",
         value=config["time"].get("include_spillover_sessions", True),
     )
 
-    df_filtered = apply_time_filter(df_raw, config, include_spillover)
-
-    st.sidebar.metric("Total Events (Raw)", len(df_raw))
-    st.sidebar.metric("Events After Time Filter", len(df_filtered))
-
-    if config.get("exclusions", {}).get("exclude_bots", True):
-        df_filtered = apply_exclusions(df_filtered, config)
-        st.sidebar.metric("Events After Exclusions", len(df_filtered))
-
-    session_df = compute_session_metrics(df_filtered)
+    counts, df_filtered, session_df, masks, tops = prepare_data(
+        args.data,
+        args.data.stat().st_mtime_ns,
+        config,
+        include_spillover,
+        use_duckdb=args.duckdb,
+    )
+    for label, count in counts.items():
+        st.sidebar.metric(label, count)
 
     tab1, tab2, tab3, tab4 = st.tabs(
         [
@@ -425,22 +705,25 @@ def main() -> None:
     )
 
     with tab1:
-        render_executive_dashboard(df_filtered, session_df)
+        render_executive_dashboard(df_filtered, session_df, masks, tops)
 
     with tab2:
-        render_traffic_engagement(df_filtered, session_df)
+        render_traffic_engagement(session_df, masks)
 
     with tab3:
-        render_query_intelligence(df_filtered)
+        render_query_intelligence(df_filtered, masks, tops)
 
     with tab4:
-        render_content_performance(df_filtered)
+        render_content_performance(df_filtered, masks, tops)
 
     st.sidebar.markdown("---")
     st.sidebar.markdown("### Export")
 
     if st.sidebar.button("Download Filtered Data (CSV)"):
-        csv_data = df_filtered.to_csv(index=False)
+        # Arrow's native CSV writer is much faster than DataFrame.to_csv
+        buffer = pa.BufferOutputStream()
+        pacsv.write_csv(pa.Table.from_pandas(df_filtered, preserve_index=False), buffer)
+        csv_data = buffer.getvalue().to_pybytes()
         st.sidebar.download_button(
             label="Download CSV",
             data=csv_data,
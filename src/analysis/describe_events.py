@@ -16,6 +16,7 @@ Usage:
 
 Dependencies:
     - pandas: For data manipulation and analysis
+    - polars: For the grouped payload key extraction
     - logloader: Custom module that provides events_df DataFrame
 
 Input:
@@ -34,6 +35,7 @@ Created: October 2025
 """
 
 import pandas as pd
+import polars as pl
 from logloader import events_df
 
 print(events_df.head())
@@ -68,24 +70,26 @@ print("\n" + "=" * 60)
 print("PAYLOAD STRUCTURE BY EVENT TYPE")
 print("=" * 60)
 
-# Extract payload keys for each event type
-payload_structure = []
-for event_type in sorted(events_df["eventType"].unique()):
-    type_df = events_df[events_df["eventType"] == event_type]
-    all_keys: set[str] = set()
-    for payload in type_df["payload"]:
-        if isinstance(payload, dict):
-            all_keys.update(payload.keys())
-
-    payload_structure.append(
-        {
-            "eventType": event_type,
-            "count": len(type_df),
-            "payload_keys": sorted(list(all_keys)),
-        }
+# Extract payload keys for each event type, in one grouped pass
+payload_keys = pl.DataFrame(
+    {
+        "eventType": events_df["eventType"].astype(str).tolist(),
+        "key": [
+            list(payload) if isinstance(payload, dict) else []
+            for payload in events_df["payload"]
+        ],
+    },
+    schema={"eventType": pl.String, "key": pl.List(pl.String)},
+)
+payload_structure = (
+    payload_keys.group_by("eventType")
+    .agg(
+        count=pl.len(),
+        payload_keys=pl.col("key").explode().drop_nulls().unique().sort(),
     )
+    .sort("eventType")
+)
 
-payload_df = pd.DataFrame(payload_structure)
-for _, row in payload_df.iterrows():
+for row in payload_structure.iter_rows(named=True):
     print(f"\n{row['eventType']} ({row['count']} events):")
     print(f"  Keys: {', '.join(row['payload_keys'])}")
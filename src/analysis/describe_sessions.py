@@ -4,8 +4,8 @@ Sessions Statistics Script.
 This script provides a quick statistical overview of web application session logs
 from the CIRED.digital project. It loads session data and generates summary statistics.
 
-The script uses the logloader module to import processed session data as a list of
-session dictionaries and performs basic exploratory data analysis to understand:
+The script uses the logloader module to import the processed events table, summarizes
+it per session in one grouped pass and performs basic exploratory data analysis to understand:
 - Session length distributions
 - Event type combinations within sessions
 - Common patterns in session event sequences
@@ -14,7 +14,8 @@ Usage:
     python describe_sessions.py
 
 Dependencies:
-    - logloader: Custom module that provides sessions list
+    - pandas: For the per-session summary and event type counts
+    - logloader: Custom module that provides the events_df table
 
 Input:
     Event data is loaded via the logloader module, which processes JSON event files
@@ -31,36 +32,44 @@ Created: October 2025
 """
 
 from collections import Counter, OrderedDict
-from typing import Any
 
-from logloader import sessions
+import pandas as pd
+from logloader import events_df
+
+# Events are in session order, summarized per session in one grouped pass
+event_types = events_df.groupby("sessionId", sort=False)["eventType"]
+session_summary = pd.DataFrame(
+    {
+        "length": event_types.size(),
+        "first": event_types.first(),
+        "last": event_types.last(),
+    }
+)
 
-print(f"Sessions loaded: {len(sessions)}")
+print(f"Sessions loaded: {len(session_summary)}")
 
-sessions_1 = [s for s in sessions if len(s["events"]) == 1]
+sessions_1 = session_summary[session_summary["length"] == 1]
 print(f"\nSessions with 1 event: {len(sessions_1)}")
 
 # Verification that one event sessions are always a sessionStart
-two_event_pairs = {(s["events"][0]["eventType"]) for s in sessions_1}
+two_event_pairs = set(sessions_1["first"])
 print(f"\nEvent type for one-event sessions: {two_event_pairs}")
 
 
-sessions_2 = [s for s in sessions if len(s["events"]) == 2]
+sessions_2 = session_summary[session_summary["length"] == 2]
 print(f"\nSessions with 2 events: {len(sessions_2)}")
 
 # Verification that two event sessions are always a sessionStart and visibilityChange
-two_event_pairs = {
-    (s["events"][0]["eventType"], s["events"][1]["eventType"]) for s in sessions_2
-}
+two_event_pairs = set(zip(sessions_2["first"], sessions_2["last"], strict=True))
 print(f"\nEvent type pairs for two-event sessions: {two_event_pairs}")
 
 
-sessions_3p = [s for s in sessions if len(s["events"]) >= 3]
+sessions_3p = session_summary[session_summary["length"] >= 3]
 print(f"\nSessions with 3+ events: {len(sessions_3p)}")
 
 # What do three+ event sessions start and end with ?
 three_plus_event_pairs = Counter(
-    (s["events"][0]["eventType"], s["events"][-1]["eventType"]) for s in sessions_3p
+    zip(sessions_3p["first"], sessions_3p["last"], strict=True)
 )
 
 print("\nStart–end event type counts for three+ event sessions:")
@@ -70,26 +79,32 @@ for pair, count in three_plus_event_pairs.most_common():
 
 # Analyze event type distributions in 3+ event sessions
 def event_type_distribution(
-    sessions: list[dict[str, Any]],
+    events: pd.DataFrame,
     event_types: tuple[str, ...] = ("request", "article", "response", "feedback"),
 ) -> dict[str, OrderedDict[int, int]]:
     """
     Count how many of each specified event type occur in each session.
 
-    Returns a dict mapping event_type (str) to an OrderedDict mapping count (int) to number of sessions (int).
+    Takes the events table (sessionId and eventType columns) of the sessions
+    to describe. Returns a dict mapping event_type (str) to an OrderedDict
+    mapping count (int) to number of sessions (int).
     """
-    distributions: dict[str, OrderedDict[int, int]] = {}
+    # Session x event type count matrix, zeros included, in one pass
+    per_session = pd.crosstab(events["sessionId"], events["eventType"]).reindex(
+        columns=list(event_types), fill_value=0
+    )
 
+    distributions: dict[str, OrderedDict[int, int]] = {}
     for etype in event_types:
-        counter = Counter(
-            sum(e["eventType"] == etype for e in s["events"]) for s in sessions
-        )
-        distributions[etype] = OrderedDict(sorted(counter.items()))
+        counts = per_session[etype].value_counts().sort_index()
+        distributions[etype] = OrderedDict(zip(counts.index.tolist(), counts.tolist()))
 
     return distributions
 
 
-distributions = event_type_distribution(sessions_3p)
+distributions = event_type_distribution(
+    events_df[events_df["sessionId"].isin(sessions_3p.index)]
+)
 print("\nEvent type distributions in 3+ event sessions:")
 for event_type, counts in distributions.items():
     print(f"{event_type}: {dict(counts)}")
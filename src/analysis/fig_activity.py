@@ -27,14 +27,22 @@ def plot_session_activity_timeline(
 
     Includes phase markers (Alpha, Beta closed, Beta open).
     """
-    # Aggregate by date
+    # Aggregate by date: distinct (date, value) pairs counted per date
+    sessions = (
+        events_df.drop_duplicates(["date", "sessionId"])
+        .groupby("date")
+        .size()
+        .rename("sessions")
+    )
+    requests = (
+        events_df.dropna(subset=["query"])
+        .drop_duplicates(["date", "query"])
+        .groupby("date")
+        .size()
+        .rename("requests")
+    )
     daily_stats = (
-        events_df.groupby("date")
-        .agg(
-            sessions=("sessionId", "nunique"),
-            requests=("query", "nunique"),
-        )
-        .reset_index()
+        pd.concat([sessions, requests], axis=1).fillna(0).astype(int).reset_index()
     )
     daily_stats["date"] = pd.to_datetime(daily_stats["date"])
 
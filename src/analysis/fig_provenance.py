@@ -6,7 +6,8 @@ French residential, bots, etc.) and renders a pie chart of visitors by
 network origin.
 
 Exports:
-- classify_bot(ip): Identify an IP's origin/bot category.
+- classify_bot(ip): Identify an IP's origin/bot category (DNS results memoized).
+- classify_ips(ips): Same for many IPs, each distinct address resolved once.
 - plot_visitors_origin_pie(sessions, save_path): Draw and optionally save the figure.
 
 Usage:
@@ -17,11 +18,20 @@ Usage:
 
 from __future__ import annotations
 
+import bisect
+import functools
 import ipaddress
+import json
+import re
 import socket
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
 import matplotlib.pyplot as plt
+import numpy as np
 
 CIRED_SUBNETS = [
     ipaddress.ip_network("193.51.120.0/24"),
@@ -42,6 +52,66 @@ RENATER_PREFIXES = [
     "194.199.",  # Many edu nets via RENATER (incl. Mines networks)
 ]
 
+# Hostname fragments of research networks, matched anywhere in the PTR name
+RESEARCH_HOST_RE = re.compile("cnrs|sorbonne|agro|enpc")
+
+# Concurrent reverse DNS lookups in classify_ips
+DNS_WORKERS = 64
+
+# Labels of resolved IPs kept between runs, under the gitignored .cache/
+DEFAULT_DNS_CACHE_PATH = (
+    Path(__file__).resolve().parents[2] / ".cache" / "visitors_dns.json"
+)
+
+# IPs whose DNS lookups failed in this process: their labels are not cached
+_DNS_FAILURES: set[str] = set()
+
+# Other address blocks recognized without DNS lookups
+BOT_AND_COUNTRY_PREFIXES = {
+    "66.249.": "googlebot",
+    "40.77.": "other bot",
+    "118.70.": "Vietnam",
+}
+
+
+def _prefix_network(prefix: str) -> ipaddress.IPv4Network:
+    """Convert a dotted prefix such as "193.51." to the network it denotes."""
+    octets = prefix.rstrip(".").split(".")
+    padded = octets + ["0"] * (4 - len(octets))
+    return ipaddress.IPv4Network(f"{'.'.join(padded)}/{8 * len(octets)}")
+
+
+def _build_ip_ranges(
+    networks: list[tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, str]],
+) -> tuple[list[int], list[str | None]]:
+    """
+    Flatten labelled networks into sorted, non-overlapping address ranges.
+
+    Where networks overlap, the first one listed wins. Returns the start of
+    each range, as integers, and its label (None for unlabelled gaps).
+    """
+    spans = [
+        (int(net.network_address), int(net.broadcast_address), label)
+        for net, label in networks
+    ]
+    bounds = sorted({lo for lo, _, _ in spans} | {hi + 1 for _, hi, _ in spans})
+    labels = [
+        next((label for lo, hi, label in spans if lo <= start <= hi), None)
+        for start in bounds
+    ]
+    return bounds, labels
+
+
+# Quick classification table, in precedence order, searched by bisection
+_RANGE_STARTS, _RANGE_LABELS = _build_ip_ranges(
+    [(net, "CIRED (CIRAD)") for net in CIRED_SUBNETS]
+    + [(_prefix_network(p), "Recherche") for p in RENATER_PREFIXES]
+    + [(_prefix_network(p), lbl) for p, lbl in BOT_AND_COUNTRY_PREFIXES.items()]
+)
+_RANGE_STARTS_ARRAY = np.array(_RANGE_STARTS, dtype=np.int64)
+# CIRED subnets as (network, netmask) integers
+_CIRED_RANGES = [(int(net.network_address), int(net.netmask)) for net in CIRED_SUBNETS]
+
 
 def is_cired(ip: str) -> bool:
     """
@@ -49,30 +119,43 @@ def is_cired(ip: str) -> bool:
 
     Gracefully handles invalid IP strings by returning False.
     """
-    try:
-        ipobj = ipaddress.ip_address(ip)
-        return any(ipobj in net for net in CIRED_SUBNETS)
-    except ValueError:
+    address = _ip_to_int(ip)
+    if address < 0:
         return False
+    return any(address & mask == network for network, mask in _CIRED_RANGES)
+
+
+def _ip_to_int(ip: str) -> int:
+    """Convert an IPv4 address to an integer, -1 when it is not one."""
+    try:
+        return int.from_bytes(socket.inet_pton(socket.AF_INET, ip), "big")
+    except (OSError, ValueError):
+        return -1
 
 
 def _quick_label_from_prefix(ip: str) -> str | None:
     """
     Fast classification using simple CIDR/prefix matches.
 
+    The IPv4 address is converted to an integer once and looked up by
+    binary search in the precomputed ranges.
+
     Returns a label when a quick decision is possible, otherwise None.
     """
-    if is_cired(ip):
-        return "CIRED (CIRAD)"
-    if any(ip.startswith(prefix) for prefix in RENATER_PREFIXES):
-        return "Recherche"
-    if ip.startswith("66.249."):
-        return "googlebot"
-    if ip.startswith("40.77."):
-        return "other bot"
-    if ip.startswith("118.70."):
-        return "Vietnam"
-    return None
+    address = _ip_to_int(ip)
+    if address < 0:
+        return None
+    index = bisect.bisect_right(_RANGE_STARTS, address) - 1
+    return _RANGE_LABELS[index] if index >= 0 else None
+
+
+def _forward_confirms(host: str, ip: str) -> bool:
+    """Check that the PTR hostname resolves back to the IP, False on failure."""
+    try:
+        return socket.gethostbyname(host) == ip
+    except OSError:
+        _DNS_FAILURES.add(ip)
+        return False
 
 
 def _label_from_host(host: str, ip: str) -> str | None:
@@ -85,7 +168,7 @@ def _label_from_host(host: str, ip: str) -> str | None:
         return "CIRED (CIRAD)"
     if "cirad" in host:
         return "CIRED (CIRAD)"
-    if any(sub in host for sub in ("cnrs", "sorbonne", "agro", "enpc")):
+    if RESEARCH_HOST_RE.search(host):
         return "Recherche"
     if host.endswith(
         (
@@ -103,8 +186,7 @@ def _label_from_host(host: str, ip: str) -> str | None:
 
     # Bots with forward-confirmation
     if host.endswith((".googlebot.com", ".google.com")):
-        expected = socket.gethostbyname(host)
-        return "googlebot" if expected == ip else None
+        return "googlebot" if _forward_confirms(host, ip) else None
     if host.endswith(
         (
             ".search.msn.com",
@@ -113,8 +195,7 @@ def _label_from_host(host: str, ip: str) -> str | None:
             "googleusercontent.com",
         )
     ):
-        expected = socket.gethostbyname(host)
-        return "other bot" if expected == ip else None
+        return "other bot" if _forward_confirms(host, ip) else None
 
     return None
 
@@ -129,11 +210,22 @@ def classify_bot(ip: str) -> str | None:
     quick = _quick_label_from_prefix(ip)
     if quick is not None:
         return quick
+    return _classify_from_dns(ip)
+
+
+@functools.cache
+def _classify_from_dns(ip: str) -> str | None:
+    """
+    Classify an IP from its reverse DNS name, when no prefix matched.
 
+    Memoized: each address is looked up, and reported, once per process.
+    Failed lookups, possibly transient, are recorded in _DNS_FAILURES.
+    """
     try:
         host, _, _ = socket.gethostbyaddr(ip)
     except Exception:
         print(f"PTR fail for {ip}")
+        _DNS_FAILURES.add(ip)
         return "Unidentified"
 
     label = _label_from_host(host, ip)
@@ -144,8 +236,59 @@ def classify_bot(ip: str) -> str | None:
     return "Unidentified"
 
 
+def _load_dns_cache(cache_path: Path) -> dict[str, str | None]:
+    """Load the labels of previously resolved IPs, empty if there is no cache."""
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cache: dict[str, str | None] = json.load(f)
+            return cache
+    except FileNotFoundError:
+        return {}
+
+
+def classify_ips(
+    ips: Sequence[str], cache_path: Path | None = None
+) -> list[str | None]:
+    """
+    Classify many client IPs, as classify_bot does for one.
+
+    Each distinct address is classified once. The prefix stage is a single
+    NumPy searchsorted over the integer addresses. Addresses without a prefix
+    match are resolved concurrently, since DNS lookups are mostly waiting,
+    with both the PTR and the forward-confirmation lookups done in the worker
+    threads; lookup failures fall back to "Unidentified". The labels of
+    successful lookups are kept in the optional JSON cache for the next run,
+    failed ones are retried then.
+    """
+    unique = list(dict.fromkeys(ips))
+    addresses = np.fromiter(map(_ip_to_int, unique), dtype=np.int64, count=len(unique))
+    index = np.searchsorted(_RANGE_STARTS_ARRAY, addresses, side="right") - 1
+    labels: dict[str, str | None] = {}
+    for ip, address, i in zip(unique, addresses, index, strict=True):
+        labels[ip] = _RANGE_LABELS[i] if address >= 0 and i >= 0 else None
+
+    dns_labels = _load_dns_cache(cache_path) if cache_path else {}
+    pending = [ip for ip, label in labels.items() if label is None]
+    unresolved = [ip for ip in pending if ip not in dns_labels]
+    if unresolved:
+        with ThreadPoolExecutor(max_workers=DNS_WORKERS) as pool:
+            dns_labels.update(zip(unresolved, pool.map(_classify_from_dns, unresolved)))
+        if cache_path:
+            cached = {
+                ip: label for ip, label in dns_labels.items() if ip not in _DNS_FAILURES
+            }
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump(cached, f, indent=1, sort_keys=True)
+    for ip in pending:
+        labels[ip] = dns_labels[ip]
+    return [labels[ip] for ip in ips]
+
+
 def plot_visitors_origin_pie(
-    sessions: list[dict[str, Any]], save_path: str | None = None
+    sessions: list[dict[str, Any]],
+    save_path: str | None = None,
+    dns_cache_path: Path | None = None,
 ) -> None:
     """
     Create a pie chart showing visitors by network origin.
@@ -153,21 +296,19 @@ def plot_visitors_origin_pie(
     Args:
         sessions: List of session dicts, each ideally with an "ip" key.
         save_path: Optional path to save the figure.
+        dns_cache_path: Optional JSON file caching reverse DNS classifications.
 
     """
     # Aggregate counts by label
-    counts: dict[str, int] = {}
-    for s in sessions:
-        ip = str(s.get("ip", ""))
-        label = classify_bot(ip) or "??"
-        counts[label] = counts.get(label, 0) + 1
+    ips = [str(s.get("ip", "")) for s in sessions]
+    counts = Counter(label or "??" for label in classify_ips(ips, dns_cache_path))
 
     if not counts:
         print("No sessions to plot.")
         return
 
-    labels = list(counts.keys())
-    sizes = [counts[k] for k in labels]
+    # Largest origins first, for a readable wedge layout
+    labels, sizes = zip(*counts.most_common(), strict=True)
 
     fig, ax = plt.subplots()
     ax.pie(sizes, labels=labels, autopct="%1.1f%%", startangle=90)
@@ -188,4 +329,6 @@ if __name__ == "__main__":
     # Lazy import to avoid side effects on import
     from logloader import sessions as _sessions
 
-    plot_visitors_origin_pie(_sessions, "visitors_origin.png")
+    plot_visitors_origin_pie(
+        _sessions, "visitors_origin.png", dns_cache_path=DEFAULT_DNS_CACHE_PATH
+    )
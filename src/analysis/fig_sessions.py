@@ -1,52 +1,49 @@
 """
 Session visualizations.
 
-    Plot a network of all sessions showing event type transitions.
+    Plot a network of all sessions showing event type transitions,
+    computed with grouped passes over the events table.
 
 Minh Ha-Duong, CNRS, 2025-11
 """
 
-from typing import Any
-
 import matplotlib.pyplot as plt
 import networkx as nx
-from logloader import sessions
+import pandas as pd
+from logloader import events_df
 
 
 def plot_session_event_type_transitions(
-    sessions: list[dict[str, Any]], save_path: str | None = None
+    events: pd.DataFrame, save_path: str | None = None
 ) -> None:
-    """Build a directed graph of event type transitions."""
-    G = nx.DiGraph()
+    """
+    Build a directed graph of event type transitions.
+
+    Takes the events table sorted by session and time, as logloader.events_df.
+    """
+    event_types = events["eventType"].astype("category")
+    # Next event type in the session, "End" after the last event
+    next_types = (
+        event_types.cat.add_categories("End")
+        .groupby(events["sessionId"], sort=False)
+        .shift(-1)
+        .fillna("End")
+    )
+    transitions = (
+        pd.DataFrame({"src": event_types, "dst": next_types})
+        .groupby(["src", "dst"], sort=False, observed=True)
+        .size()
+    )
 
     # Track total events per node
-    event_counts: dict[str, int] = {}
-
-    for session in sessions:
-        events = session["events"]
-
-        # Count all events
-        for event in events:
-            event_type = event["eventType"]
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
-
-        # Build transition edges
-        for i in range(len(events) - 1):
-            src = events[i]["eventType"]
-            dst = events[i + 1]["eventType"]
-            if G.has_edge(src, dst):
-                G[src][dst]["weight"] += 1
-            else:
-                G.add_edge(src, dst, weight=1)
-
-        # Add edge from last event to sessionEnd
-        if events:
-            last_event = events[-1]["eventType"]
-            if G.has_edge(last_event, "End"):
-                G[last_event]["End"]["weight"] += 1
-            else:
-                G.add_edge(last_event, "End", weight=1)
-            event_counts["End"] = event_counts.get("End", 0) + 1
+    event_counts = event_types.value_counts().to_dict()
+    event_counts["End"] = events["sessionId"].nunique()
+
+    G = nx.DiGraph()
+    G.add_weighted_edges_from(
+        transitions.reset_index().itertuples(index=False, name=None)
+    )
+
     # Draw the graph
     plt.figure(figsize=(12, 8))
 
@@ -98,52 +95,41 @@ def plot_session_event_type_transitions(
     plt.close()
 
 
-def simplify(session: dict[str, Any]) -> dict[str, Any]:
-    """Simplify session by dropping consecutive "visibilityOff, visibilityOn" events and the final visibilityOff."""
-    simplified_events = []
-    skip_next = False
-
-    events = session["events"]
-    for i, event in enumerate(events):
-        if skip_next:
-            skip_next = False
-            continue
-
-        # Skip only "visibilityOff" events that are immediately followed by "visibilityOn" events,
-        if (
-            event["eventType"] == "visibilityOff"
-            and i + 1 < len(events)
-            and events[i + 1]["eventType"] == "visibilityOn"
-        ):
-            skip_next = (
-                True  # Skip both this "visibilityOff" and the next "visibilityOn" event
-            )
-            continue  # Skip this "visibilityOff" event
-
-        # Relabel nodes
-        if event["eventType"] == "userInput":
-            event["eventType"] = "btnClick"
-        if event["eventType"] == "sessionStart":
-            event["eventType"] = "Start"
-        if event["eventType"] == "visibilityOn":
-            event["eventType"] = "visible"
-        if event["eventType"] == "visibilityOff":
-            event["eventType"] = "hidden"
-
-        simplified_events.append(event)
+# Node labels of the simplified graph
+SIMPLIFIED_LABELS = {
+    "userInput": "btnClick",
+    "sessionStart": "Start",
+    "visibilityOn": "visible",
+    "visibilityOff": "hidden",
+}
 
-    # Remove final "hidden" if it exists
-    if simplified_events and simplified_events[-1]["eventType"] == "hidden":
-        simplified_events.pop()
 
-    session["events"] = simplified_events
-    return session
+def simplify_events(events: pd.DataFrame) -> pd.DataFrame:
+    """
+    Simplify sessions by dropping consecutive "visibilityOff, visibilityOn" events and the final visibilityOff.
+
+    Returns a new events table, sorted as the input, with the simplified labels.
+    """
+    by_session = events.groupby("sessionId", sort=False)["eventType"]
+    # "visibilityOff" events immediately followed by "visibilityOn", and the latter
+    pair_start = (events["eventType"] == "visibilityOff") & (
+        by_session.shift(-1) == "visibilityOn"
+    )
+    pair_end = pair_start.groupby(events["sessionId"], sort=False).shift(
+        1, fill_value=False
+    )
+    kept = events[~(pair_start | pair_end)].assign(
+        # Mapped once per category when eventType is categorical
+        eventType=lambda df: df["eventType"].map(lambda t: SIMPLIFIED_LABELS.get(t, t))
+    )
+
+    # Remove final "hidden" if it exists
+    is_last = ~kept["sessionId"].duplicated(keep="last")
+    return kept[~(is_last & (kept["eventType"] == "hidden"))]
 
 
 if __name__ == "__main__":
-    plot_session_event_type_transitions(sessions, "session_event_type_transitions.png")
-
-    sessions = [simplify(session) for session in sessions]
+    plot_session_event_type_transitions(events_df, "session_event_type_transitions.png")
     plot_session_event_type_transitions(
-        sessions, "session_event_type_transitions_simplified.png"
+        simplify_events(events_df), "session_event_type_transitions_simplified.png"
     )
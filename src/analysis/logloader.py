@@ -2,23 +2,127 @@
 Load and process monitoring log files stored in a nested directory structure.
 
 Exports:
-- events_df: DataFrame with all individual events
-- sessions: DataFrame with aggregated session-level metrics
+- events_df: DataFrame with all individual events, sorted by session then time,
+  with their position in the session as event_idx and a categorical eventType
+- sessions: List of session dicts with aggregated metrics, and the session's rows
+  of events_df as the event_slice positional slice
+
+Both are built on first access, so importing one does not pay for the other.
+
+The loaded events are cached in .cache/monitor_events.parquet at the repository
+root; only the day directories whose files changed are parsed again.
 
 Usage:
     from logloader import events_df, sessions
 """
 
-import glob
-import json
+import functools
+import hashlib
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+import msgspec
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 DEFAULT_BASE_PATH = Path(__file__).resolve().parents[2] / "reports" / "monitor-logs"
+DEFAULT_CACHE_PATH = (
+    Path(__file__).resolve().parents[2] / ".cache" / "monitor_events.parquet"
+)
 DEFAULT_MIN_DATE = "20250705"
+DAY_NAMES = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+]
+# Characters of the event timestamps, e.g. 20250717T164957230Z
+COMPACT_TIMESTAMP_LENGTH = 19
+# Digits of the YYYY, MM and DD directory names, by the length of the date above
+DATE_PART_LENGTHS = {0: 4, 4: 2, 6: 2}
+# Event files, and the daily logs of one event per line of the monitor service
+LOG_SUFFIXES = (".json", ".ndjson")
+# Below this many files, a process pool costs more to start than it saves
+PARALLEL_MIN_FILES = 2000
+
+# Fields of a monitor event file, all required
+EVENT_FIELDS = ["sessionId", "timestamp", "eventType", "payload", "server_context"]
+# Nested fields, stored as JSON text in the cache
+JSON_FIELDS = ["payload", "server_context"]
+
+
+class MonitorLogEvent(msgspec.Struct):
+    """A monitor event file, as written by the monitor service."""
+
+    sessionId: str
+    timestamp: str
+    eventType: str
+    payload: dict[str, Any]
+    server_context: dict[str, Any]
+
+
+# Decodes and validates in one pass: missing fields raise a ValidationError
+MONITOR_LOG_DECODER = msgspec.json.Decoder(MonitorLogEvent)
+
+
+def _load_file(file_path: str) -> tuple[list[dict[str, Any]], int]:
+    """
+    Read an event file, or a daily NDJSON log of one event per line.
+
+    Returns the valid events and the number of records that could not be
+    read or are not valid events.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return [], 1
+    records = data.splitlines() if file_path.endswith(".ndjson") else [data]
+    events = []
+    errors = 0
+    for record in records:
+        if not record.strip():
+            continue
+        try:
+            event = MONITOR_LOG_DECODER.decode(record)
+        except msgspec.DecodeError:
+            # DecodeError includes ValidationError: missing or mistyped fields
+            errors += 1
+        else:
+            events.append(msgspec.structs.asdict(event))
+    return events, errors
+
+
+def _load_files(
+    file_paths: list[str], max_workers: int | None = None
+) -> list[tuple[list[dict[str, Any]], int]]:
+    """
+    Read the event files and daily logs, in order, in a process pool when there are many.
+
+    Workers are forked so that they do not re-run the importing script;
+    where fork is unavailable the files are read serially.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if (
+        workers < 2
+        or len(file_paths) < PARALLEL_MIN_FILES
+        or "fork" not in multiprocessing.get_all_start_methods()
+    ):
+        return [_load_file(p) for p in file_paths]
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("fork")
+    ) as pool:
+        return list(pool.map(_load_file, file_paths, chunksize=64))
 
 
 def _resolve_base_path(base_path: str | Path | None) -> Path:
@@ -33,78 +137,210 @@ def _resolve_base_path(base_path: str | Path | None) -> Path:
     return resolved
 
 
+def _dir_fingerprints(json_files: list[tuple[str, int, int]]) -> dict[str, str]:
+    """Hash the paths, sizes and modification times of the files of each directory."""
+    digests: dict[str, Any] = {}
+    for file_path, size, mtime_ns in sorted(json_files):
+        digest = digests.setdefault(os.path.dirname(file_path), hashlib.sha256())
+        digest.update(f"{file_path}\0{size}\0{mtime_ns}\n".encode())
+    return {directory: digest.hexdigest() for directory, digest in digests.items()}
+
+
+def _read_cache(
+    cache_path: Path, fingerprints: dict[str, str]
+) -> tuple[list[dict[str, Any]], list[str], set[str], bool]:
+    """
+    Read the cached events of the directories whose files are unchanged.
+
+    Returns the events, their directories, the set of directories read, and
+    whether the cache is complete: it holds exactly the current directories,
+    all up to date.
+    """
+    try:
+        metadata = pq.read_schema(cache_path).metadata or {}
+        cached_fingerprints = orjson.loads(metadata[b"fingerprints"])
+    except (OSError, KeyError, pa.ArrowInvalid, orjson.JSONDecodeError):
+        return [], [], set(), False
+    valid = [d for d, fp in fingerprints.items() if cached_fingerprints.get(d) == fp]
+    table = pq.read_table(cache_path, filters=[("directory", "in", valid)])
+    columns = table.to_pydict()
+    directories: list[str] = columns.pop("directory")
+    for field in JSON_FIELDS:
+        columns[field] = [orjson.loads(v) for v in columns[field]]
+    events = [
+        dict(zip(columns, values, strict=True)) for values in zip(*columns.values())
+    ]
+    complete = valid == list(cached_fingerprints) == list(fingerprints)
+    return events, directories, set(valid), complete
+
+
+def _write_cache(
+    cache_path: Path,
+    fingerprints: dict[str, str],
+    all_events: list[dict[str, Any]],
+    directories: list[str],
+) -> None:
+    """Save the events with their directory, tagged with the directory fingerprints."""
+    columns = {
+        field: [
+            orjson.dumps(e[field]).decode() if field in JSON_FIELDS else e[field]
+            for e in all_events
+        ]
+        for field in EVENT_FIELDS
+    }
+    columns["directory"] = directories
+    table = pa.table(
+        columns,
+        schema=pa.schema([(f, pa.string()) for f in [*EVENT_FIELDS, "directory"]]),
+    ).replace_schema_metadata({"fingerprints": orjson.dumps(fingerprints)})
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, cache_path, compression="zstd")
+
+
+def _sub_date(date: str | None, name: str) -> str | None:
+    """
+    Extend the date digits of a directory with a subdirectory name.
+
+    Returns None outside the YYYY/MM/DD layout.
+    """
+    if date is None or len(date) not in DATE_PART_LENGTHS:
+        return None
+    if len(name) == DATE_PART_LENGTHS[len(date)] and name.isdigit():
+        return date + name
+    return None
+
+
+def _iter_json_files(root: Path, min_date: str) -> list[tuple[str, int, int]]:
+    """
+    List the log files below root dated min_date or later, with os.scandir.
+
+    In the monitor-logs/YYYY/MM/DD layout, directories entirely before
+    min_date are pruned without being listed; files outside the layout are
+    kept. Hidden entries are skipped, as glob does.
+
+    Returns:
+        List of (path, size_bytes, mtime_ns) tuples, stats from the DirEntry.
+
+    """
+    files: list[tuple[str, int, int]] = []
+    if not root.is_dir():
+        return files
+    # Directories to list, with the date digits of their path (None if not dated)
+    stack: list[tuple[str, str | None]] = [(str(root), "")]
+    while stack:
+        directory, date = stack.pop()
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    sub_date = _sub_date(date, entry.name)
+                    if sub_date is None or sub_date >= min_date[: len(sub_date)]:
+                        stack.append((entry.path, sub_date))
+                elif entry.name.endswith(LOG_SUFFIXES) and entry.is_file():
+                    st = entry.stat()
+                    files.append((entry.path, st.st_size, st.st_mtime_ns))
+    return files
+
+
 def load_all_log_files(
-    base_path: str | Path | None = None, min_date: str = DEFAULT_MIN_DATE
+    base_path: str | Path | None = None,
+    min_date: str = DEFAULT_MIN_DATE,
+    cache_path: Path | None = DEFAULT_CACHE_PATH,
+    max_workers: int | None = None,
 ) -> list[dict[str, Any]]:
     """
-    Load all JSON files from the log directory structure.
+    Load all JSON files and daily NDJSON logs from the log directory structure.
 
     If base_path is None, uses DEFAULT_BASE_PATH resolved relative to this module.
+    The events are also saved to the Parquet file cache_path, and read back
+    from it for each directory whose files are unchanged, so that only new
+    or modified days are parsed; None disables it.
+    Large sets of files are parsed by max_workers processes (default: all cores).
     """
     resolved_base = _resolve_base_path(base_path)
 
-    all_events: list[dict[str, Any]] = []
     file_count = 0
     error_count = 0
-    skipped_count = 0
-
-    # Use glob to find all JSON files recursively (path resolved against resolved_base)
-    json_pattern = str(resolved_base / "**" / "*.json")
-    json_files = glob.glob(json_pattern, recursive=True)
 
-    print(f"Found {len(json_files)} JSON files total")
+    # Walk the directory tree, skipping the days before min_date
+    json_files = _iter_json_files(resolved_base, min_date)
     if min_date:
-        print(f"Filtering for files from {min_date} onwards\n")
+        print(f"Found {len(json_files)} JSON files from {min_date} onwards\n")
+    else:
+        print(f"Found {len(json_files)} JSON files total\n")
 
-    # Load each file
-    for file_path in json_files:
-        # Filter by date if min_date is specified
-        if min_date:
-            # Extract date from path: monitor-logs/YYYY/MM/DD/...
-            path_parts = file_path.split(os.sep)
-            if len(path_parts) >= 4:
-                try:
-                    year = path_parts[-4]
-                    month = path_parts[-3]
-                    day = path_parts[-2]
-                    file_date = f"{year}{month}{day}"
-                    if file_date < min_date:
-                        skipped_count += 1
-                        continue
-                except (ValueError, IndexError):
-                    pass
+    # Reuse the cached events of unchanged directories, parse the others
+    fingerprints = _dir_fingerprints(json_files) if cache_path else {}
+    all_events: list[dict[str, Any]] = []
+    directories: list[str] = []
+    cached: set[str] = set()
+    complete = False
+    if cache_path:
+        all_events, directories, cached, complete = _read_cache(
+            cache_path, fingerprints
+        )
+        if all_events:
+            print(
+                f"Loaded {len(all_events)} events of {len(cached)} unchanged "
+                f"directories from cache: {cache_path}"
+            )
+    selected_files = [
+        file_path
+        for file_path, _, _ in json_files
+        if os.path.dirname(file_path) not in cached
+    ]
 
-        try:
-            with open(file_path) as f:
-                event_data = json.load(f)
-
-            # Validate required fields
-            if all(
-                key in event_data
-                for key in [
-                    "sessionId",
-                    "timestamp",
-                    "eventType",
-                    "payload",
-                    "server_context",
-                ]
-            ):
-                all_events.append(event_data)
-                file_count += 1
-            else:
-                error_count += 1
-
-        except (OSError, json.JSONDecodeError):
-            error_count += 1
-
-    print(f"Successfully loaded: {file_count} files")
-    print(f"Skipped (before cutoff): {skipped_count} files")
+    # Load each file
+    for file_path, (events, errors) in zip(
+        selected_files, _load_files(selected_files, max_workers), strict=True
+    ):
+        all_events.extend(events)
+        directories.extend([os.path.dirname(file_path)] * len(events))
+        error_count += errors
+        if not errors:
+            file_count += 1
+
+    if selected_files or not cached:
+        print(f"Successfully loaded: {file_count} files")
     if error_count > 0:
-        print(f"Errors encountered: {error_count} files")
+        print(f"Errors encountered: {error_count} records")
 
+    if cache_path and not complete:
+        _write_cache(cache_path, fingerprints, all_events, directories)
     return all_events
 
 
+def _parse_timestamps(timestamps: pd.Series) -> pd.Series:
+    """
+    Parse the compact UTC timestamps of the events, e.g. 20250717T164957230Z.
+
+    When all values have the millisecond layout of the frontend's
+    toISOString, their characters are rearranged into ISO 8601 in a NumPy
+    array and parsed by NumPy in C. Otherwise pd.to_datetime parses them
+    with the %Y%m%dT%H%M%S%fZ format, which raises ValueError on mismatch.
+    """
+    values = timestamps.to_numpy(dtype=str)
+    fixed_length = values.dtype.itemsize == COMPACT_TIMESTAMP_LENGTH * 4 and bool(
+        (np.char.str_len(values) == COMPACT_TIMESTAMP_LENGTH).all()
+    )
+    chars = values.view("U1").reshape(len(values), -1) if fixed_length else None
+    if chars is None or not ((chars[:, 8] == "T") & (chars[:, 18] == "Z")).all():
+        return pd.to_datetime(timestamps, format="%Y%m%dT%H%M%S%fZ")
+    # YYYYMMDDTHHMMSSsssZ -> YYYY-MM-DDTHH:MM:SS.sss
+    iso = np.empty((len(values), 23), dtype="U1")
+    iso[:, [4, 7]] = "-"
+    iso[:, 10] = "T"
+    iso[:, [13, 16]] = ":"
+    iso[:, 19] = "."
+    for target, source in ((0, 0), (5, 4), (8, 6), (11, 9), (14, 11), (17, 13)):
+        width = 4 if target == 0 else 2
+        iso[:, target : target + width] = chars[:, source : source + width]
+    iso[:, 20:23] = chars[:, 15:18]
+    parsed = iso.view("U23").ravel().astype("datetime64[us]")
+    return pd.Series(parsed, index=timestamps.index, name=timestamps.name)
+
+
 def create_events_dataframe(all_events: list[dict[str, Any]]) -> pd.DataFrame:
     """
     Create and process the events DataFrame.
@@ -127,17 +363,24 @@ def create_events_dataframe(all_events: list[dict[str, Any]]) -> pd.DataFrame:
 
     # Parse timestamp to datetime with error handling
     try:
-        df["timestamp"] = pd.to_datetime(df["timestamp"], format="%Y%m%dT%H%M%S%fZ")
+        df["timestamp"] = _parse_timestamps(df["timestamp"])
     except ValueError as e:
         print(
             f"Warning: Some timestamps couldn't be parsed with the expected format: {e}"
         )
         df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
 
+    # Events of a session contiguous and in order, for grouped passes
+    df = df.sort_values(["sessionId", "timestamp"], kind="stable", ignore_index=True)
+    df["event_idx"] = df.groupby("sessionId", sort=False).cumcount()
+
     # Add derived columns for analysis
-    df["date"] = df["timestamp"].dt.date
-    df["hour"] = df["timestamp"].dt.hour
-    df["day_of_week"] = df["timestamp"].dt.day_name()
+    # Compact dtypes: midnight datetimes, small integers and categories
+    df["date"] = df["timestamp"].dt.normalize()
+    df["hour"] = df["timestamp"].dt.hour.astype("int8")
+    df["day_of_week"] = pd.Categorical(
+        df["timestamp"].dt.day_name(), categories=DAY_NAMES, ordered=True
+    )
     df["minute"] = df["timestamp"].dt.floor("1min")
 
     print(f"DataFrame created with shape: {df.shape}")
@@ -154,31 +397,27 @@ def augment_dataframe(events_df: pd.DataFrame) -> None:
         events_df: DataFrame to modify in place
 
     """
+    event_type = events_df["eventType"]
     # The client IP from the server_context
-    events_df["ip"] = [context["client_ip"] for context in events_df["server_context"]]
+    events_df["ip"] = events_df["server_context"].map(itemgetter("client_ip"))
     # The user agent from payload for "sessionStart" event types
-    events_df["ua"] = [
-        payload["userAgent"] if etype == "sessionStart" else None
-        for etype, payload in zip(events_df["eventType"], events_df["payload"])
-    ]
+    is_start = event_type.eq("sessionStart")
+    events_df["ua"] = events_df["payload"][is_start].map(itemgetter("userAgent"))
     # The query text for "request" event types
-    events_df["query"] = [
-        payload["query"] if etype == "request" else None
-        for etype, payload in zip(events_df["eventType"], events_df["payload"])
-    ]
+    is_request = event_type.eq("request")
+    events_df["query"] = events_df["payload"][is_request].map(itemgetter("query"))
     # Rename "visibilityChange" events to "visibilityOn" or "visibilityOff"
-    events_df["eventType"] = [
-        (
-            "visibilityOn"
-            if etype == "visibilityChange"
-            and payload.get("visibilityState") == "visible"
-            else "visibilityOff"
-            if etype == "visibilityChange"
-            and payload.get("visibilityState") == "hidden"
-            else etype
-        )
-        for etype, payload in zip(events_df["eventType"], events_df["payload"])
-    ]
+    is_visibility = event_type.eq("visibilityChange")
+    state = (
+        events_df["payload"][is_visibility]
+        .map(lambda payload: payload.get("visibilityState"))
+        .reindex(events_df.index)
+    )
+    events_df["eventType"] = event_type.mask(state.eq("visible"), "visibilityOn").mask(
+        state.eq("hidden"), "visibilityOff"
+    )
+    # Few distinct event types: group and count on integer codes
+    events_df["eventType"] = events_df["eventType"].astype("category")
 
 
 def create_sessions_list(events_df: pd.DataFrame) -> list[dict[str, Any]]:
@@ -189,19 +428,39 @@ def create_sessions_list(events_df: pd.DataFrame) -> list[dict[str, Any]]:
         events_df: DataFrame of events
 
     Returns:
-        List[Dict[str, Any]]: List of session dictionaries
+        List[Dict[str, Any]]: List of session dictionaries, whose event_slice
+        selects the session's events with events_df.iloc
 
     """
     sessions: list[dict[str, Any]] = []
-    for session_id, group in events_df.groupby("sessionId"):
+    if events_df.empty:
+        return sessions
+    # events_df is sorted by session and time: each session is a run of rows
+    session_ids = events_df["sessionId"].to_numpy()
+    starts = np.flatnonzero(np.r_[True, session_ids[1:] != session_ids[:-1]])
+    ends = np.r_[starts[1:], len(session_ids)]
+    # Scalar aggregates in one grouped pass; ip and ua of each first event
+    times = events_df.groupby("sessionId", sort=False)["timestamp"].agg(["min", "max"])
+    ips = events_df["ip"].to_numpy()[starts]
+    uas = events_df["ua"].to_numpy()[starts]
+    for start, end, ip, ua, start_time, end_time in zip(
+        starts.tolist(),
+        ends.tolist(),
+        ips,
+        uas,
+        times["min"],
+        times["max"],
+        strict=True,
+    ):
         session_dict: dict[str, Any] = {
-            "sessionId": session_id,
-            "ip": group["ip"].iloc[0],
-            "ua": group["ua"].iloc[0],
-            "start_time": group["timestamp"].min(),
-            "end_time": group["timestamp"].max(),
-            "event_count": len(group),
-            "events": group.sort_values("timestamp").to_dict(orient="records"),
+            "sessionId": session_ids[start],
+            "ip": ip,
+            "ua": ua,
+            "start_time": start_time,
+            "end_time": end_time,
+            "event_count": end - start,
+            # Rows of the session in events_df: events_df.iloc[event_slice]
+            "event_slice": slice(start, end),
         }
         sessions.append(session_dict)
 
@@ -210,25 +469,42 @@ def create_sessions_list(events_df: pd.DataFrame) -> list[dict[str, Any]]:
 
 
 # ============================================================================
-# MODULE INITIALIZATION - Load data when module is imported
+# LAZY MODULE ATTRIBUTES - Load data on first access to events_df or sessions
 # ============================================================================
 
-print("=" * 70)
-print("Loading monitor logs...\n")
 
-# Load all events
-all_events = load_all_log_files()
+@functools.cache
+def load_events_df() -> pd.DataFrame:
+    """Load, parse and augment the monitor events, once per process."""
+    print("=" * 70)
+    print("Loading monitor logs...\n")
+
+    # Load all events
+    all_events = load_all_log_files()
+
+    # Create events DataFrame
+    events_df = create_events_dataframe(all_events)
+
+    # Augment DataFrame with additional features
+    if not events_df.empty:
+        augment_dataframe(events_df)
+        print("DataFrame augmented with query column and renamed visibility events")
+
+    print("\n✓ Module loaded successfully")
+    print("=" * 70)
+    return events_df
 
-# Create events DataFrame
-events_df = create_events_dataframe(all_events)
 
-# Augment DataFrame with additional features
-if not events_df.empty:
-    augment_dataframe(events_df)
-    print("DataFrame augmented with query column and renamed visibility events")
+@functools.cache
+def load_sessions() -> list[dict[str, Any]]:
+    """Build the sessions list from the events, once per process."""
+    return create_sessions_list(load_events_df())
 
-# Create sessions DataFrame
-sessions = create_sessions_list(events_df)
 
-print("\n✓ Module loaded successfully")
-print("=" * 70)
+def __getattr__(name: str) -> Any:
+    """Build events_df and sessions when first imported (PEP 562)."""
+    if name == "events_df":
+        return load_events_df()
+    if name == "sessions":
+        return load_sessions()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
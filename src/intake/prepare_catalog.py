@@ -99,7 +99,8 @@ def process_publications(
     unique_df = dedup_df.drop_duplicates(subset="doiId_s", keep="first")
     # Combine no-DOI records, special cases and deduplicated records
     final_df = pd.concat([no_doi_df, special_df, unique_df], ignore_index=True)
-    pubs_list = final_df.to_dict(orient="records")
+    # The ranking column is only needed for deduplication, not in the catalog
+    pubs_list = final_df.drop(columns="prio").to_dict(orient="records")
     # Recalculate duplicates_excluded
     duplicates_excluded = (total - excluded) - len(pubs_list)
 
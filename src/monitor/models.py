@@ -33,9 +33,9 @@ class MonitorEvent(BaseModel):
     Attributes
     ----------
     sessionId : str
-        Sanitized session identifier.
+        Session identifier, as sent by the client.
     timestamp : str
-        ISO-formatted timestamp (sanitized for filenames).
+        ISO-formatted timestamp.
     data_type : MonitorEventType
         Type of event (enum).
     payload : dict[str, Any]
@@ -47,3 +47,26 @@ class MonitorEvent(BaseModel):
     timestamp: str
     eventType: MonitorEventType
     payload: dict[str, Any]
+
+
+class ServerContext(BaseModel):
+    """Context added by the monitor server to each event it receives."""
+
+    client_ip: str
+    forwarded_for: str | None
+    received_at: str
+    server_version: str
+
+
+class EnrichedMonitorEvent(MonitorEvent):
+    """
+    A monitoring event with its server context, as written to the daily logs.
+
+    Attributes
+    ----------
+    server_context : ServerContext
+        Client IP and reception time, added by the server.
+
+    """
+
+    server_context: ServerContext
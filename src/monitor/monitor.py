@@ -4,17 +4,129 @@ Monitor Cirdi app.
 A FastAPI application to collect Cirdi analytics.
 """
 
+import asyncio
+import fcntl
+import functools
 import json
+import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
+from typing import TextIO
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
-from models import MonitorEvent
-from utils import sanitize
+from fastapi.responses import HTMLResponse, JSONResponse
+from models import EnrichedMonitorEvent, MonitorEvent, ServerContext
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
+
+# Events waiting to be written to disk, and how many the writer takes at once
+EVENT_QUEUE_SIZE = 10_000
+WRITE_BATCH_SIZE = 100
+# Seconds allowed at shutdown for the writer to save the queued events
+SHUTDOWN_FLUSH_TIMEOUT = 10.0
+
+PRIVACY_TEMPLATE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "templates", "privacy.html"
+)
+
+EventRecord = tuple[str, EnrichedMonitorEvent]  # (log_path, event)
+
+
+def _open_log(log_path: str, open_logs: dict[str, TextIO]) -> TextIO:
+    """
+    Return the append handle of a daily log, opening it on first use.
+
+    Handles of the previous days are closed: only today's log is written to.
+    """
+    f = open_logs.get(log_path)
+    if f is None:
+        for stale in open_logs.values():
+            stale.close()
+        open_logs.clear()
+        os.makedirs(os.path.dirname(log_path), exist_ok=True)
+        f = open_logs[log_path] = open(log_path, "a", encoding="utf-8")
+    return f
+
+
+def _write_events(batch: list[EventRecord], open_logs: dict[str, TextIO]) -> None:
+    """Append a batch of events to their daily logs, one JSON object per line."""
+    lines: dict[str, list[str]] = {}
+    for log_path, event in batch:
+        # Serialized by pydantic-core straight from the model, without a dict
+        lines.setdefault(log_path, []).append(event.model_dump_json() + "\n")
+    for log_path, log_lines in lines.items():
+        f = _open_log(log_path, open_logs)
+        # Serializes appends if the app ever runs in several processes
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            f.write("".join(log_lines))
+            f.flush()
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+async def _writer(queue: asyncio.Queue[EventRecord]) -> None:
+    """Drain the event queue in batches, writing them in a worker thread."""
+    # Daily logs stay open between batches, closed when the writer stops
+    open_logs: dict[str, TextIO] = {}
+    try:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < WRITE_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            write = asyncio.ensure_future(
+                asyncio.to_thread(_write_events, batch, open_logs)
+            )
+            try:
+                await asyncio.shield(write)
+            except asyncio.CancelledError:
+                # A thread cannot be interrupted: let the batch finish writing
+                # before the logs are closed below
+                await asyncio.gather(write, return_exceptions=True)
+                raise
+            except Exception:
+                # Keep the writer alive; reopen the logs for the next batch
+                logger.exception("Failed to write %d monitor events", len(batch))
+                for f in open_logs.values():
+                    f.close()
+                open_logs.clear()
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    finally:
+        for f in open_logs.values():
+            f.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the background event writer, flushing pending events on shutdown."""
+    app.state.queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+    app.state.writer_task = asyncio.create_task(_writer(app.state.queue))
+    yield
+    writer_task = app.state.writer_task
+    if writer_task.done():
+        logger.error(
+            "Monitor event writer stopped with %d events still queued",
+            app.state.queue.qsize(),
+        )
+    else:
+        try:
+            await asyncio.wait_for(app.state.queue.join(), SHUTDOWN_FLUSH_TIMEOUT)
+        except TimeoutError:
+            logger.error(
+                "Shutdown timeout with %d monitor events still queued",
+                app.state.queue.qsize(),
+            )
+    writer_task.cancel()
+    # Wait for the writer to close its logs; its own error was logged above
+    await asyncio.gather(writer_task, return_exceptions=True)
+
+
+app = FastAPI(lifespan=lifespan)
 
 # CORS support
 app.add_middleware(
@@ -32,20 +144,27 @@ async def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@functools.cache
+def _privacy_response() -> HTMLResponse:
+    """Build the privacy page response once, on first request, cacheable by clients."""
+    with open(PRIVACY_TEMPLATE, encoding="utf-8") as f:
+        return HTMLResponse(
+            content=f.read(), headers={"Cache-Control": "public, max-age=3600"}
+        )
+
+
 @app.get("/v1/view/privacy", response_class=HTMLResponse)
-async def view_privacy() -> FileResponse:
+async def view_privacy() -> HTMLResponse:
     """
     Serve the privacy statement with a description of data collected and the user's rights.
 
     Returns
     -------
-    FileResponse
+    HTMLResponse
         The privacy HTML page.
 
     """
-    return FileResponse(
-        os.path.join("templates", "privacy.html"), media_type="text/html"
-    )
+    return _privacy_response()
 
 
 @app.post("/v1/monitor")
@@ -62,7 +181,7 @@ async def monitor_event(request: Request) -> dict[str, str]:
     Returns
     -------
     dict[str, str]
-        Success message.
+        Acknowledgement that the event was queued for writing.
 
     """
     # Handle both JSON and text/plain (from sendBeacon)
@@ -90,40 +209,29 @@ async def monitor_event(request: Request) -> dict[str, str]:
         # Fallback to direct connection IP (shouldn't happen with NPM)
         client_ip = request.client.host if request.client else "unknown"
 
-    enriched_event = {
-        **event.model_dump(),  # Original client data
-        "server_context": {  # Server-added context
-            "client_ip": client_ip,
-            "forwarded_for": forwarded_for,
-            "received_at": datetime.now(UTC).isoformat(),
-            "server_version": "1.0.0",
-        },
-    }
-
-    # Sanitize sessionId, timestamp, eventType for filename:
-    #  allow only alphanumeric characters and underscores.
-    # Specially necessary for event.sessionId, which is user-provided
-    # and could contain characters that are not safe for filenames.
-    # This is a security measure to prevent path traversal attacks.
-    # Tell CodeQL that we trust our sanitize()
-    safe_session = sanitize(event.sessionId)
-    safe_timestamp = sanitize(event.timestamp)
-    safe_type = sanitize(event.eventType)
-    # Directory: /data/logs/YYYY/MM/DD/
+    # Original client data, already validated, with the server-added context
+    enriched_event = EnrichedMonitorEvent.model_construct(
+        **dict(event),
+        server_context=ServerContext(
+            client_ip=client_ip,
+            forwarded_for=forwarded_for,
+            received_at=datetime.now(UTC).isoformat(),
+            server_version="1.0.0",
+        ),
+    )
+
+    # Daily log: /data/logs/YYYY/MM/DD/YYYYMMDD.ndjson
+    # The path only depends on the server's clock, never on client data.
     now = datetime.now(UTC)
-    dir_path = os.path.join(
-        "data", "logs", f"{now.year:04d}", f"{now.month:02d}", f"{now.day:02d}"
+    log_path = os.path.join(
+        "data",
+        "logs",
+        f"{now.year:04d}",
+        f"{now.month:02d}",
+        f"{now.day:02d}",
+        f"{now:%Y%m%d}.ndjson",
     )
-    os.makedirs(dir_path, exist_ok=True)
-    # Now save the event as a JSON file
-    filename = f"{safe_session}-{safe_timestamp}-{safe_type}.json"
-    file_path = os.path.normpath(os.path.realpath(os.path.join(dir_path, filename)))
-    abs_dir_path = os.path.normpath(os.path.realpath(dir_path))
-    # Ensure the resolved file_path is strictly within the intended directory
-    if os.path.commonpath([abs_dir_path, file_path]) != abs_dir_path:
-        raise ValueError("Invalid file path: potential path traversal detected")
-
-    # CodeQL alert on next line suppressed because we trust sanitize()
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(enriched_event, f, ensure_ascii=False, indent=2)
-    return {"message": "Monitor event saved"}
+
+    # The background writer does the disk I/O off the event loop
+    await request.app.state.queue.put((log_path, enriched_event))
+    return {"message": "Monitor event accepted"}
@@ -2,15 +2,21 @@
 Utility functions for analytics data processing.
 
 This module provides:
-- Sanitization of strings for safe use as filenames or identifiers
 - Network classification based on IP address
 """
 
+import socket
 
-def sanitize(s: str) -> str:
-    """Ensure the string is safe for use as a filename or identifier."""
-    sanitized = "".join(c if c.isalnum() else "_" for c in s).strip("_")
-    return sanitized[:32]
+# CIRED network 193.51.120.0/24, as (network, netmask) integers
+CIRED_NETWORK = (0xC1337800, 0xFFFFFF00)
+
+
+def _ipv4_to_int(ip_address: str) -> int | None:
+    """Pack a dotted IPv4 address into an integer, None if it is not one."""
+    try:
+        return int.from_bytes(socket.inet_pton(socket.AF_INET, ip_address), "big")
+    except OSError:
+        return None
 
 
 def classify_network(ip_address: str) -> str:
@@ -24,7 +30,8 @@ def classify_network(ip_address: str) -> str:
         A string representing the network type (e.g., 'CIRED', 'ENPC', 'EXTERNE').
 
     """
-    if ip_address.startswith("193.51.120."):
+    address = _ipv4_to_int(ip_address)
+    network, netmask = CIRED_NETWORK
+    if address is not None and address & netmask == network:
         return "CIRED"
-    else:
-        return "EXTERNE"
+    return "EXTERNE"
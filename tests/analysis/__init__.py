@@ -0,0 +1 @@
+"""Declare the directory  tests/analysis  as a Python package."""
@@ -0,0 +1,39 @@
+"""Fixtures for the tests of the monitor log analysis scripts in src/analysis."""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# The analysis scripts import each other as top-level modules
+sys.path.insert(0, str(REPO_ROOT / "src" / "analysis"))
+
+
+@pytest.fixture(scope="session")
+def monitor_logs() -> Path:
+    """Root of the sample monitor logs, one JSON file per event."""
+    return REPO_ROOT / "tests" / "fixtures" / "reports" / "monitor-logs"
+
+
+@pytest.fixture(scope="session")
+def monitor_schema() -> Path:
+    """Pydantic schema of the monitor events."""
+    return REPO_ROOT / "src" / "monitor" / "models.py"
+
+
+@pytest.fixture(scope="session")
+def ndjson_logs() -> Path:
+    """Root of the events of 2025-07-11 as one daily NDJSON log."""
+    return REPO_ROOT / "tests" / "fixtures" / "reports" / "monitor-logs-ndjson"
+
+
+@pytest.fixture
+def json_day(monitor_logs: Path, tmp_path: Path) -> Path:
+    """Root of the same events of 2025-07-11, one JSON file per event."""
+    root = tmp_path / "monitor-logs-json"
+    day = Path("2025") / "07" / "11"
+    shutil.copytree(monitor_logs / day, root / day)
+    return root
@@ -0,0 +1,144 @@
+"""Tests for the validation modes of analyze_monitor_logs."""
+
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from analyze_monitor_logs import (
+    FILENAME_RE,
+    _parse_filename_fast,
+    walk_and_collect,
+    write_outputs,
+)
+
+
+def _normalize(
+    root: Path, out: Path, schema: Path | None, **options: bool
+) -> pd.DataFrame:
+    """Run the loader on root and read back its Parquet output, in file order."""
+    columns = walk_and_collect(root, schema_path=schema, max_workers=2, **options)
+    write_outputs(columns, out, write_csv=False, write_parquet=True)
+    df = pd.read_parquet(out.with_suffix(".parquet"))
+    return df.sort_values("source_file", kind="stable", ignore_index=True)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"use_msgspec": True}, {"trust_input": True}],
+    ids=lambda o: next(iter(o)),
+)
+def test_fast_modes_match_schema_validation(
+    monitor_logs: Path, monitor_schema: Path, tmp_path: Path, options: dict[str, bool]
+) -> None:
+    """--msgspec and --trust-input produce the same table as --schema validation."""
+    expected = _normalize(monitor_logs, tmp_path / "schema", monitor_schema)
+    result = _normalize(monitor_logs, tmp_path / "fast", monitor_schema, **options)
+    assert "query" in expected.columns
+    assert set(expected["canonical_event_type"]) <= {
+        "sessionStart",
+        "request",
+        "response",
+        "article",
+        "feedback",
+        "userProfile",
+        "userInput",
+        "visibilityChange",
+    }
+    pd.testing.assert_frame_equal(result, expected, check_categorical=False)
+
+
+@pytest.mark.parametrize("use_msgspec", [False, True], ids=["schema", "msgspec"])
+def test_ndjson_log_matches_event_files(
+    ndjson_logs: Path,
+    json_day: Path,
+    monitor_schema: Path,
+    tmp_path: Path,
+    use_msgspec: bool,
+) -> None:
+    """A daily NDJSON log gives the same rows as the per-event JSON files."""
+    file_columns = ["source_file", "size_bytes", "mtime_utc"]
+    sort_keys = ["sessionId", "timestamp", "payload_json"]
+    tables = [
+        _normalize(root, tmp_path / root.name, monitor_schema, use_msgspec=use_msgspec)
+        .drop(columns=file_columns)
+        .sort_values(sort_keys, ignore_index=True)
+        for root in (ndjson_logs, json_day)
+    ]
+    assert len(tables[0]) == 35
+    assert tables[0]["valid"].all()
+    pd.testing.assert_frame_equal(*tables, check_categorical=False)
+
+
+@pytest.mark.parametrize("trust_input", [False, True], ids=["schema", "trust_input"])
+def test_malformed_events_are_reported(
+    monitor_schema: Path, tmp_path: Path, trust_input: bool
+) -> None:
+    """Events missing required fields are invalid rows, in files and daily logs."""
+    malformed = {"eventType": "request", "payload": {"query": "climat"}}
+    day = tmp_path / "logs" / "2025" / "07" / "11"
+    day.mkdir(parents=True)
+    (day / "session_abc-20250711T080000000Z-request.json").write_text(
+        json.dumps(malformed)
+    )
+    (day / "20250711.ndjson").write_text(json.dumps(malformed) + "\n")
+
+    df = _normalize(
+        tmp_path / "logs", tmp_path / "out", monitor_schema, trust_input=trust_input
+    )
+
+    assert len(df) == 2
+    assert not df["valid"].any()
+    assert df["validation_error"].str.contains("sessionId").all()
+
+
+def test_msgspec_validity_matches_schema(monitor_schema: Path, tmp_path: Path) -> None:
+    """--msgspec rejects exactly the events that --schema validation rejects."""
+    event = {
+        "sessionId": "session_abc",
+        "timestamp": "2025-07-11T08:00:00.000Z",
+        "eventType": "request",
+        "payload": {"query": "climat"},
+    }
+    events = [
+        event,
+        {k: v for k, v in event.items() if k != "sessionId"},
+        {k: v for k, v in event.items() if k != "timestamp"},
+        {k: v for k, v in event.items() if k != "payload"},
+        {**event, "eventType": "unknownType"},
+        {**event, "sessionId": None},
+    ]
+    day = tmp_path / "logs" / "2025" / "07" / "11"
+    day.mkdir(parents=True)
+    (day / "20250711.ndjson").write_text("".join(json.dumps(e) + "\n" for e in events))
+
+    valid = [
+        _normalize(
+            tmp_path / "logs", tmp_path / name, monitor_schema, use_msgspec=use_msgspec
+        )["valid"].tolist()
+        for name, use_msgspec in (("schema", False), ("msgspec", True))
+    ]
+
+    assert valid[0] == [True, False, False, False, False, False]
+    assert valid[1] == valid[0]
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "session_1752170012739_64e6b366d3-20250710T175832792Z-request.json",
+        "session_a-b_c-20250710T175832792Z-userInput.json",
+        "session___-20250710T175832792Z-article.json",
+        "session_a b-20250710T175832792Z-request.json",
+        "session_a.b-20250710T175832792Z-request.json",
+        "session_a/../b-20250710T175832792Z-request.json",
+        "session_é-20250710T175832792Z-request.json",
+        "session_x-20250710T1758327920-request.json",
+        "session_x-20250710T175832792Z-req1.json",
+    ],
+)
+def test_fast_filename_parser_matches_regex(name: str) -> None:
+    """The slicing parser accepts and splits exactly what FILENAME_RE matches."""
+    m = FILENAME_RE.fullmatch(name)
+    expected = (m.group("key"), m.group("ts"), m.group("type")) if m else None
+    assert _parse_filename_fast(name) == expected
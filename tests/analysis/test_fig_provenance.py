@@ -0,0 +1,31 @@
+"""Tests for the reverse DNS cache of fig_provenance."""
+
+import json
+import socket
+from pathlib import Path
+
+import fig_provenance
+import pytest
+
+
+def test_failed_lookups_are_not_cached(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """A PTR failure labels the IP "Unidentified" but is retried on the next run."""
+    hosts = {"203.0.113.1": "box.wanadoo.fr"}
+
+    def gethostbyaddr(ip: str) -> tuple[str, list[str], list[str]]:
+        if ip not in hosts:
+            raise socket.herror("timeout")
+        return hosts[ip], [], [ip]
+
+    monkeypatch.setattr(socket, "gethostbyaddr", gethostbyaddr)
+    monkeypatch.setattr(fig_provenance, "_DNS_FAILURES", set())
+    fig_provenance._classify_from_dns.cache_clear()
+    cache_path = tmp_path / "cache" / "visitors_dns.json"
+
+    labels = fig_provenance.classify_ips(["203.0.113.1", "203.0.113.2"], cache_path)
+
+    assert labels == ["French Residential", "Unidentified"]
+    assert json.loads(cache_path.read_text()) == {"203.0.113.1": "French Residential"}
+    fig_provenance._classify_from_dns.cache_clear()
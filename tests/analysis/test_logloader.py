@@ -0,0 +1,90 @@
+"""Tests for the incremental Parquet event cache of logloader."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+import logloader
+import pytest
+
+DAYS = ["10", "11", "12"]
+
+
+@pytest.fixture
+def logs(monitor_logs: Path, tmp_path: Path) -> Path:
+    """Copy a few fixture days to a writable directory."""
+    root = tmp_path / "monitor-logs"
+    for day in DAYS:
+        shutil.copytree(monitor_logs / "2025" / "07" / day, root / "2025" / "07" / day)
+    return root
+
+
+def _load(
+    root: Path, cache_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> tuple[list[dict[str, Any]], set[str]]:
+    """Load the events, also returning the directories of the files parsed."""
+    parsed: set[str] = set()
+    load_files = logloader._load_files
+
+    def spy(file_paths: list[str], max_workers: int | None = None) -> Any:
+        parsed.update(os.path.dirname(p) for p in file_paths)
+        return load_files(file_paths, max_workers)
+
+    monkeypatch.setattr(logloader, "_load_files", spy)
+    events = logloader.load_all_log_files(root, cache_path=cache_path)
+    return events, parsed
+
+
+def _key(event: dict[str, Any]) -> tuple[str, str, str]:
+    return event["sessionId"], event["timestamp"], event["eventType"]
+
+
+def test_cache_rereads_only_changed_directories(
+    logs: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Unchanged days come from the cache, a modified day is parsed again."""
+    cache_path = tmp_path / "cache" / "events.parquet"
+    first, parsed = _load(logs, cache_path, monkeypatch)
+    assert len(parsed) == len(DAYS)
+
+    cached, parsed = _load(logs, cache_path, monkeypatch)
+    assert parsed == set()
+    assert sorted(cached, key=_key) == sorted(first, key=_key)
+
+    # Change one event of one day
+    changed_dir = logs / "2025" / "07" / "11"
+    changed_file = sorted(changed_dir.glob("*.json"))[0]
+    event = json.loads(changed_file.read_text())
+    event["payload"] = {**event["payload"], "changed": True}
+    changed_file.write_text(json.dumps(event))
+
+    updated, parsed = _load(logs, cache_path, monkeypatch)
+    assert parsed == {str(changed_dir)}
+    fresh = logloader.load_all_log_files(logs, cache_path=None)
+    assert sorted(updated, key=_key) == sorted(fresh, key=_key)
+    assert sum(e["payload"].get("changed", False) for e in updated) == 1
+
+
+def test_cache_without_fingerprints_is_ignored(
+    logs: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A cache file without the fingerprints metadata is rebuilt from the logs."""
+    cache_path = tmp_path / "events.parquet"
+    cache_path.write_bytes(b"not a parquet file")
+
+    events, parsed = _load(logs, cache_path, monkeypatch)
+
+    assert len(parsed) == len(DAYS)
+    assert events
+    _, parsed = _load(logs, cache_path, monkeypatch)
+    assert parsed == set()
+
+
+def test_ndjson_log_loads_like_event_files(ndjson_logs: Path, json_day: Path) -> None:
+    """A daily NDJSON log gives the same events as the per-event JSON files."""
+    from_ndjson = logloader.load_all_log_files(ndjson_logs, cache_path=None)
+    from_json = logloader.load_all_log_files(json_day, cache_path=None)
+    assert len(from_ndjson) == 35
+    assert sorted(from_ndjson, key=_key) == sorted(from_json, key=_key)
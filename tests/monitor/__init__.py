@@ -0,0 +1 @@
+"""Declare the directory  tests/monitor  as a Python package."""
@@ -0,0 +1,9 @@
+"""Fixtures for the tests of the monitor app in src/monitor."""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# The monitor app imports its models as a top-level module
+sys.path.insert(0, str(REPO_ROOT / "src" / "monitor"))
@@ -0,0 +1,55 @@
+"""Tests for the event collection endpoint of the monitor app."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")  # needed by the TestClient
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from monitor import app  # noqa: E402
+
+
+def test_events_are_written_when_the_app_stops(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Accepted events are all in the daily NDJSON log once the lifespan exits."""
+    monkeypatch.chdir(tmp_path)  # logs are written under ./data/logs
+    events = [
+        {
+            "sessionId": f"session_{i}",
+            "timestamp": "2025-07-11T08:00:00.000Z",
+            "eventType": "request",
+            "payload": {"query": f"climat {i}"},
+        }
+        for i in range(250)
+    ]
+
+    with TestClient(app) as client:
+        for i, event in enumerate(events):
+            if i % 2:
+                # sendBeacon() posts the event as text/plain
+                response = client.post(
+                    "/v1/monitor",
+                    content=json.dumps(event),
+                    headers={"content-type": "text/plain"},
+                )
+            else:
+                response = client.post(
+                    "/v1/monitor",
+                    json=event,
+                    headers={"x-forwarded-for": "193.51.120.1, 10.0.0.1"},
+                )
+            assert response.status_code == 200
+            assert response.json() == {"message": "Monitor event accepted"}
+
+    (log,) = (tmp_path / "data" / "logs").rglob("*.ndjson")
+    written = [json.loads(line) for line in log.read_text().splitlines()]
+    # One client posts in sequence, so the log keeps the posting order
+    assert [
+        {k: v for k, v in event.items() if k != "server_context"} for event in written
+    ] == events
+    assert written[0]["server_context"]["client_ip"] == "193.51.120.1"